@@ -0,0 +1,29 @@
+"""adiciona indice em transacao.data
+
+Revision ID: b7e2d4a91c3f
+Revises: 856715defdd8
+Create Date: 2026-01-10 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a91c3f'
+down_revision: Union[str, Sequence[str], None] = '856715defdd8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filtros por período (data >= inicio AND data < fim) passam a usar range scan
+    op.create_index(op.f('ix_transacao_data'), 'transacao', ['data'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_transacao_data'), table_name='transacao')
@@ -0,0 +1,58 @@
+"""adiciona cascade delete em transacaotag
+
+Revision ID: 4c9a1e7f2b6d
+Revises: b7e2d4a91c3f
+Create Date: 2026-01-10 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c9a1e7f2b6d'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d4a91c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Adiciona CASCADE DELETE nas foreign keys da tabela transacaotag."""
+    # Drop constraints antigas
+    op.drop_constraint('transacaotag_transacao_id_fkey', 'transacaotag', type_='foreignkey')
+    op.drop_constraint('transacaotag_tag_id_fkey', 'transacaotag', type_='foreignkey')
+    
+    # Recria constraints com CASCADE DELETE
+    op.create_foreign_key(
+        'transacaotag_transacao_id_fkey',
+        'transacaotag', 'transacao',
+        ['transacao_id'], ['id'],
+        ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        'transacaotag_tag_id_fkey',
+        'transacaotag', 'tag',
+        ['tag_id'], ['id'],
+        ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    """Remove CASCADE DELETE das foreign keys."""
+    # Drop constraints com CASCADE
+    op.drop_constraint('transacaotag_transacao_id_fkey', 'transacaotag', type_='foreignkey')
+    op.drop_constraint('transacaotag_tag_id_fkey', 'transacaotag', type_='foreignkey')
+    
+    # Recria constraints sem CASCADE
+    op.create_foreign_key(
+        'transacaotag_transacao_id_fkey',
+        'transacaotag', 'transacao',
+        ['transacao_id'], ['id']
+    )
+    op.create_foreign_key(
+        'transacaotag_tag_id_fkey',
+        'transacaotag', 'tag',
+        ['tag_id'], ['id']
+    )
@@ -0,0 +1,35 @@
+"""recria indice unico lower em tag.nome
+
+Revision ID: a81d3c6e5f02
+Revises: 4c9a1e7f2b6d
+Create Date: 2026-01-10 10:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a81d3c6e5f02'
+down_revision: Union[str, Sequence[str], None] = '4c9a1e7f2b6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 856715defdd8 removeu os índices em lower(nome); recria o único, que atende
+    # às buscas case-insensitive por nome (ex.: tag "Rotina") e garante unicidade
+    op.create_index(
+        'idx_tag_nome_lower_unique',
+        'tag',
+        [sa.text('lower(nome)')],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_tag_nome_lower_unique', table_name='tag')
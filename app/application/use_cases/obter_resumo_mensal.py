@@ -65,8 +65,8 @@ class ObterResumoMensalUseCase:
         except:
             criterio = "data_transacao"  # Default
         
-        # Buscar transações com os filtros aplicados
-        transacoes = self._transacao_repository.listar(
+        # Somas por tipo e categoria calculadas no banco (uma linha por grupo)
+        somas = self._transacao_repository.somar_por_categoria(
             mes=mes,
             ano=ano,
             data_inicio=data_inicio,
@@ -81,11 +81,11 @@ class ObterResumoMensalUseCase:
         total_entradas = 0.0
         total_saidas = 0.0
         
-        for transacao in transacoes:
-            categoria = transacao.categoria or "Sem categoria"
-            valor = transacao.valor
+        for tipo, categoria, valor in somas:
+            # Categoria vazia/None cai em "Sem categoria" (pode juntar dois grupos)
+            categoria = categoria or "Sem categoria"
             
-            if transacao.tipo.value == "entrada":
+            if tipo.value == "entrada":
                 entradas_por_categoria[categoria] = entradas_por_categoria.get(categoria, 0.0) + valor
                 total_entradas += valor
             else:  # saida
@@ -10,7 +10,7 @@ from app.domain.value_objects.regra_enums import TipoAcao, CriterioTipo
 from app.domain.entities.transacao import Transacao
 
 
-@dataclass
+@dataclass(slots=True)
 class Regra:
     """
     Entidade de domínio representando uma regra automática.
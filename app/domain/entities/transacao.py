@@ -9,7 +9,7 @@ from typing import Optional, List
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 
 
-@dataclass
+@dataclass(slots=True)
 class Transacao:
     """
     Entidade de domínio representando uma transação financeira.
@@ -32,6 +32,11 @@ class IRegraRepository(ABC):
         """Busca regra por ID"""
         pass
     
+    @abstractmethod
+    def buscar_por_nome(self, nome: str) -> Optional[Regra]:
+        """Busca regra por nome (case-insensitive)"""
+        pass
+    
     @abstractmethod
     def listar(self, apenas_ativas: bool = False) -> List[Regra]:
         """
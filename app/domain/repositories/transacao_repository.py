@@ -4,7 +4,7 @@ Define o contrato que implementações concretas devem seguir
 """
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.domain.entities.transacao import Transacao
 from app.domain.value_objects.tipo_transacao import TipoTransacao
@@ -74,6 +74,32 @@ class ITransacaoRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def somar_por_categoria(
+        self,
+        mes: Optional[int] = None,
+        ano: Optional[int] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        tag_ids: Optional[List[int]] = None,
+        criterio_data: str = "data_transacao"
+    ) -> List[Tuple[TipoTransacao, Optional[str], float]]:
+        """
+        Soma os valores das transações agrupados por tipo e categoria.
+        
+        Args:
+            mes: Mês para filtrar (1-12)
+            ano: Ano para filtrar
+            data_inicio: Data inicial do período
+            data_fim: Data final do período
+            tag_ids: Lista de IDs de tags (operação OR)
+            criterio_data: "data_transacao" ou "data_fatura"
+            
+        Returns:
+            Lista de (tipo, categoria, total); categoria pode ser None
+        """
+        pass
+    
     @abstractmethod
     def atualizar(self, transacao: Transacao) -> Transacao:
         """
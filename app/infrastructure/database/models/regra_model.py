@@ -34,7 +34,7 @@ class RegraModel(SQLModel, table=True):
     # Relacionamento many-to-many com tags (para ADICIONAR_TAGS)
     tags: List["RegraTagModel"] = Relationship(
         back_populates="regra",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True}
     )
 
 
@@ -1,7 +1,8 @@
 """
 SQLModel Models para Tags
 """
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Column
+from sqlalchemy import Integer, ForeignKey, Index, func
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from pydantic import model_validator
@@ -28,10 +29,10 @@ class TagModel(SQLModel, table=True):
     criado_em: datetime = Field(default_factory=datetime.now)
     atualizado_em: datetime = Field(default_factory=datetime.now)
     
-    # Relacionamentos
+    # Relacionamentos (associações removidas pelo ON DELETE CASCADE do banco)
     transacoes: List["TransacaoTagModel"] = Relationship(
         back_populates="tag",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True}
     )
     
     @model_validator(mode='after')
@@ -42,6 +43,11 @@ class TagModel(SQLModel, table=True):
         return self
 
 
+# Índice único em lower(nome) criado pela migração a81d3c6e5f02; declarado aqui
+# para que o schema de testes (create_all) fique igual ao de produção
+Index("idx_tag_nome_lower_unique", func.lower(TagModel.nome), unique=True)
+
+
 class TransacaoTagModel(SQLModel, table=True):
     """
     Tabela de associação many-to-many entre Transacao e Tag.
@@ -50,8 +56,8 @@ class TransacaoTagModel(SQLModel, table=True):
     __tablename__ = "transacaotag"  # type: ignore
     __table_args__ = {'extend_existing': True}  # type: ignore
     
-    transacao_id: int = Field(foreign_key="transacao.id", primary_key=True)
-    tag_id: int = Field(foreign_key="tag.id", primary_key=True)
+    transacao_id: int = Field(sa_column=Column(Integer, ForeignKey("transacao.id", ondelete="CASCADE"), primary_key=True))
+    tag_id: int = Field(sa_column=Column(Integer, ForeignKey("tag.id", ondelete="CASCADE"), primary_key=True))
     criado_em: datetime = Field(default_factory=datetime.now)
     
     # Relacionamentos
@@ -23,7 +23,7 @@ class TransacaoModel(SQLModel, table=True):
     __table_args__ = {'extend_existing': True}  # type: ignore
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    data: date = Field(description="Data da transação")
+    data: date = Field(index=True, description="Data da transação")
     descricao: str = Field(description="Descrição da transação")
     valor: float = Field(description="Valor da transação")
     valor_original: Optional[float] = Field(default=None, description="Valor original antes de edições")
@@ -35,10 +35,10 @@ class TransacaoModel(SQLModel, table=True):
     criado_em: datetime = Field(default_factory=datetime.now)
     atualizado_em: datetime = Field(default_factory=datetime.now)
     
-    # Relacionamento com tags (CASCADE DELETE)
+    # Relacionamento com tags (CASCADE DELETE feito pelo banco, sem carregar as associações)
     tags: List["TransacaoTagModel"] = Relationship(
         back_populates="transacao",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True}
     )
     
     @field_validator('data_fatura')
@@ -23,7 +23,7 @@ class ConfiguracaoRepository(IConfiguracaoRepository):
     def obter(self, chave: str) -> Optional[str]:
         """Obtém valor de uma configuração"""
         query = select(ConfiguracaoModel).where(ConfiguracaoModel.chave == chave)
-        model = self._session.exec(query).first()
+        model = self._session.exec(query.limit(1)).first()
         if not model:
             return None
         return model.valor
@@ -31,7 +31,7 @@ class ConfiguracaoRepository(IConfiguracaoRepository):
     def salvar(self, chave: str, valor: str) -> None:
         """Salva ou atualiza uma configuração"""
         query = select(ConfiguracaoModel).where(ConfiguracaoModel.chave == chave)
-        model = self._session.exec(query).first()
+        model = self._session.exec(query.limit(1)).first()
         
         if model:
             # Atualiza existente
@@ -53,7 +53,7 @@ class ConfiguracaoRepository(IConfiguracaoRepository):
     def deletar(self, chave: str) -> bool:
         """Deleta uma configuração"""
         query = select(ConfiguracaoModel).where(ConfiguracaoModel.chave == chave)
-        model = self._session.exec(query).first()
+        model = self._session.exec(query.limit(1)).first()
         if not model:
             return False
         
@@ -4,7 +4,7 @@ Implementação concreta do repositório de Regras usando SQLModel
 from typing import List, Optional
 import json
 
-from sqlmodel import Session, select, func
+from sqlmodel import Session, select, func, delete, insert
 
 from app.domain.entities.regra import Regra
 from app.domain.repositories.regra_repository import IRegraRepository
@@ -57,7 +57,7 @@ class RegraRepository(IRegraRepository):
     def buscar_por_nome(self, nome: str) -> Optional[Regra]:
         """Busca regra por nome (case-insensitive)"""
         query = select(RegraModel).where(func.lower(RegraModel.nome) == nome.lower())
-        model = self._session.exec(query).first()
+        model = self._session.exec(query.limit(1)).first()
         if not model:
             return None
         return self._to_entity(model)
@@ -167,16 +167,17 @@ class RegraRepository(IRegraRepository):
         Sincroniza tags associadas a uma regra.
         Remove associações antigas e adiciona novas.
         """
-        # Remove associações antigas
-        query = select(RegraTagModel).where(RegraTagModel.regra_id == regra_id)
-        associacoes_antigas = self._session.exec(query).all()
-        for assoc in associacoes_antigas:
-            self._session.delete(assoc)
-        
-        # Adiciona novas associações
-        for tag_id in tag_ids:
-            nova_assoc = RegraTagModel(regra_id=regra_id, tag_id=tag_id)
-            self._session.add(nova_assoc)
+        # Remove associações antigas em um único DELETE
+        self._session.execute(
+            delete(RegraTagModel).where(RegraTagModel.regra_id == regra_id)
+        )
+        
+        # Adiciona novas associações em um único executemany
+        if tag_ids:
+            self._session.execute(
+                insert(RegraTagModel),
+                [{"regra_id": regra_id, "tag_id": tag_id} for tag_id in tag_ids]
+            )
         
         self._session.commit()
     
@@ -46,7 +46,7 @@ class TagRepository(ITagRepository):
     def buscar_por_nome(self, nome: str) -> Optional[Tag]:
         """Busca tag por nome (case-insensitive)"""
         query = select(TagModel).where(func.lower(TagModel.nome) == nome.lower())
-        model = self._session.exec(query).first()
+        model = self._session.exec(query.limit(1)).first()
         if not model:
             return None
         return self._to_entity(model)
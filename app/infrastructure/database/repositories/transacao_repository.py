@@ -1,10 +1,10 @@
 """
 Implementação concreta do repositório de Transações usando SQLModel
 """
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
 
-from sqlmodel import Session, select, or_, func
+from sqlmodel import Session, select, or_, func, delete, insert
 
 from app.domain.entities.transacao import Transacao
 from app.domain.value_objects.tipo_transacao import TipoTransacao
@@ -65,15 +65,7 @@ class TransacaoRepository(ITransacaoRepository):
         query = select(TransacaoModel)
         
         # Filtro de período
-        if data_inicio and data_fim:
-            query = self._aplicar_filtro_data(query, data_inicio, data_fim, criterio_data)
-        elif mes and ano:
-            data_inicio_calc = date(ano, mes, 1)
-            if mes < 12:
-                data_fim_calc = date(ano, mes + 1, 1)
-            else:
-                data_fim_calc = date(ano + 1, 1, 1)
-            query = self._aplicar_filtro_data(query, data_inicio_calc, data_fim_calc, criterio_data)
+        query = self._aplicar_periodo(query, mes, ano, data_inicio, data_fim, criterio_data)
         
         # Filtro de categoria
         if categoria:
@@ -95,6 +87,36 @@ class TransacaoRepository(ITransacaoRepository):
         models = self._session.exec(query).all()
         return [self._to_entity(m) for m in models]
     
+    def somar_por_categoria(
+        self,
+        mes: Optional[int] = None,
+        ano: Optional[int] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        tag_ids: Optional[List[int]] = None,
+        criterio_data: str = "data_transacao"
+    ) -> List[Tuple[TipoTransacao, Optional[str], float]]:
+        """Soma valores por tipo e categoria (GROUP BY no banco)"""
+        query = select(
+            TransacaoModel.tipo,
+            TransacaoModel.categoria,
+            func.sum(TransacaoModel.valor)
+        )
+        query = self._aplicar_periodo(query, mes, ano, data_inicio, data_fim, criterio_data)
+        
+        # Filtro de tags (OR) via subquery, para não somar a transação uma vez por tag
+        if tag_ids:
+            query = query.where(
+                TransacaoModel.id.in_(
+                    select(TransacaoTagModel.transacao_id).where(TransacaoTagModel.tag_id.in_(tag_ids))
+                )
+            )
+        
+        query = query.group_by(TransacaoModel.tipo, TransacaoModel.categoria)
+        
+        linhas = self._session.exec(query).all()
+        return [(TipoTransacao[tipo], categoria, total) for tipo, categoria, total in linhas]
+    
     def atualizar(self, transacao: Transacao) -> Transacao:
         """Atualiza transação existente"""
         if not transacao.id:
@@ -117,16 +139,21 @@ class TransacaoRepository(ITransacaoRepository):
         model.atualizado_em = transacao.atualizado_em
         
         # Atualiza tags (remove antigas e adiciona novas)
-        # Remove tags existentes
-        stmt = select(TransacaoTagModel).where(TransacaoTagModel.transacao_id == transacao.id)
-        existing_tags = self._session.exec(stmt).all()
-        for tag_rel in existing_tags:
-            self._session.delete(tag_rel)
+        # Remove tags existentes em um único DELETE
+        self._session.execute(
+            delete(TransacaoTagModel).where(TransacaoTagModel.transacao_id == transacao.id)
+        )
         
-        # Adiciona novas tags
-        for tag_id in transacao.tag_ids:
-            tag_rel = TransacaoTagModel(transacao_id=transacao.id, tag_id=tag_id)
-            self._session.add(tag_rel)
+        # Adiciona novas tags em um único executemany
+        if transacao.tag_ids:
+            agora = datetime.now()
+            self._session.execute(
+                insert(TransacaoTagModel),
+                [
+                    {"transacao_id": transacao.id, "tag_id": tag_id, "criado_em": agora}
+                    for tag_id in transacao.tag_ids
+                ]
+            )
         
         self._session.commit()
         self._session.refresh(model)
@@ -159,47 +186,49 @@ class TransacaoRepository(ITransacaoRepository):
     ) -> int:
         """Conta transações com filtros"""
         query = select(func.count(TransacaoModel.id))
+        query = self._aplicar_periodo(query, mes, ano, data_inicio, data_fim, criterio_data)
         
+        return self._session.exec(query).one()
+    
+    def _aplicar_periodo(
+        self,
+        query,
+        mes: Optional[int],
+        ano: Optional[int],
+        data_inicio: Optional[date],
+        data_fim: Optional[date],
+        criterio: str
+    ):
+        """Aplica o período (data_inicio/data_fim inclusivos, ou mes/ano) na query"""
         if data_inicio and data_fim:
-            query = self._aplicar_filtro_data_count(query, data_inicio, data_fim, criterio_data)
-        elif mes and ano:
+            return self._aplicar_filtro_data(query, data_inicio, data_fim + timedelta(days=1), criterio)
+        if mes and ano:
             data_inicio_calc = date(ano, mes, 1)
             if mes < 12:
                 data_fim_calc = date(ano, mes + 1, 1)
             else:
                 data_fim_calc = date(ano + 1, 1, 1)
-            query = self._aplicar_filtro_data_count(query, data_inicio_calc, data_fim_calc, criterio_data)
-        
-        return self._session.exec(query).one()
-    
-    def _aplicar_filtro_data(self, query, data_inicio: date, data_fim: date, criterio: str):
-        """Aplica filtro de data na query"""
-        if criterio == "data_fatura":
-            return query.where(
-                or_(
-                    (TransacaoModel.data_fatura >= data_inicio) & (TransacaoModel.data_fatura <= data_fim),
-                    (TransacaoModel.data_fatura.is_(None)) & (TransacaoModel.data >= data_inicio) & (TransacaoModel.data <= data_fim)
-                )
-            )
-        else:
-            return query.where(
-                TransacaoModel.data >= data_inicio,
-                TransacaoModel.data <= data_fim
-            )
+            return self._aplicar_filtro_data(query, data_inicio_calc, data_fim_calc, criterio)
+        return query
     
-    def _aplicar_filtro_data_count(self, query, data_inicio: date, data_fim: date, criterio: str):
-        """Aplica filtro de data na query de contagem"""
+    def _aplicar_filtro_data(self, query, data_inicio: date, data_fim_exclusivo: date, criterio: str):
+        """
+        Aplica filtro de data na query.
+
+        Intervalo semiaberto [data_inicio, data_fim_exclusivo): comparações diretas
+        na coluna (sem funções sobre ela) permitem usar o índice de data.
+        """
         if criterio == "data_fatura":
             return query.where(
                 or_(
-                    (TransacaoModel.data_fatura >= data_inicio) & (TransacaoModel.data_fatura <= data_fim),
-                    (TransacaoModel.data_fatura.is_(None)) & (TransacaoModel.data >= data_inicio) & (TransacaoModel.data <= data_fim)
+                    (TransacaoModel.data_fatura >= data_inicio) & (TransacaoModel.data_fatura < data_fim_exclusivo),
+                    (TransacaoModel.data_fatura.is_(None)) & (TransacaoModel.data >= data_inicio) & (TransacaoModel.data < data_fim_exclusivo)
                 )
             )
         else:
             return query.where(
                 TransacaoModel.data >= data_inicio,
-                TransacaoModel.data <= data_fim
+                TransacaoModel.data < data_fim_exclusivo
             )
     
     def listar_categorias(self) -> List[str]:
@@ -227,13 +256,8 @@ class TransacaoRepository(ITransacaoRepository):
     
     def adicionar_tag(self, transacao_id: int, tag_id: int) -> None:
         """Adiciona uma tag a uma transação (evita duplicatas)"""
-        # Verifica se já existe a associação
-        existing = self._session.exec(
-            select(TransacaoTagModel).where(
-                TransacaoTagModel.transacao_id == transacao_id,
-                TransacaoTagModel.tag_id == tag_id
-            )
-        ).first()
+        # Verifica se já existe a associação (lookup pela chave primária composta)
+        existing = self._session.get(TransacaoTagModel, (transacao_id, tag_id))
         
         if existing:
             return  # Já existe, não precisa adicionar
@@ -253,13 +277,8 @@ class TransacaoRepository(ITransacaoRepository):
     
     def remover_tag(self, transacao_id: int, tag_id: int) -> None:
         """Remove uma tag de uma transação"""
-        # Busca a associação
-        associacao = self._session.exec(
-            select(TransacaoTagModel).where(
-                TransacaoTagModel.transacao_id == transacao_id,
-                TransacaoTagModel.tag_id == tag_id
-            )
-        ).first()
+        # Busca a associação (lookup pela chave primária composta)
+        associacao = self._session.get(TransacaoTagModel, (transacao_id, tag_id))
         
         if not associacao:
             return  # Não existe, nada a fazer
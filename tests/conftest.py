@@ -6,6 +6,7 @@ import pytest
 from datetime import date, datetime
 from unittest.mock import Mock
 from sqlmodel import Session, create_engine, SQLModel
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
 
 
@@ -27,11 +28,29 @@ def datetime_exemplo():
     return datetime(2026, 1, 15, 10, 30, 0)
 
 
-@pytest.fixture(scope="function")
-def db_session():
+def _configurar_sqlite(dbapi_connection, connection_record):
+    """PRAGMAs de banco descartável: sem fsync nem journal em disco, com FKs ativas"""
+    # pysqlite abre transações por conta própria; deixar BEGIN/SAVEPOINT com o SQLAlchemy
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")  # ON DELETE CASCADE, como no PostgreSQL
+    cursor.close()
+
+
+def _iniciar_transacao(conn):
+    """Emite o BEGIN que o pysqlite deixou de emitir (necessário para SAVEPOINT)"""
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def test_engine():
     """
-    Fixture para testes de integração com banco de dados SQLite em memória.
-    Cada teste recebe uma sessão limpa e isolada.
+    Engine SQLite em memória com todas as tabelas criadas uma única vez.
+    Compartilhada por db_session e pelos fixtures dos testes de API; o
+    isolamento entre testes vem da transação externa desfeita em db_session.
     """
     # Importar todos os modelos para que SQLModel.metadata seja populado
     from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa: F401
@@ -44,16 +63,55 @@ def db_session():
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        insertmanyvalues_page_size=1000,  # inserts em lote com menos round-trips
     )
+    event.listen(engine, "connect", _configurar_sqlite)
+    event.listen(engine, "begin", _iniciar_transacao)
 
     # Criar todas as tabelas
     SQLModel.metadata.create_all(engine)
 
-    # Criar sessão
-    with Session(engine) as session:
-        yield session
-        session.rollback()  # Reverter qualquer mudança após o teste
+    yield engine
 
     # Limpar metadata
     SQLModel.metadata.drop_all(engine)
     engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(test_engine):
+    """
+    Fixture para testes de integração com banco de dados SQLite em memória.
+    Cada teste roda dentro de uma transação externa desfeita ao final; os
+    commit() feitos pelos repositórios apenas liberam SAVEPOINTs.
+    
+    expire_on_commit=False evita o SELECT de recarga após cada commit. Cuidado:
+    a mesma sessão atende a API e o teste, então objetos já carregados não veem
+    alterações feitas por DELETE/UPDATE em lote; use session.refresh() se precisar.
+    """
+    connection = test_engine.connect()
+    transacao = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+
+    yield session
+
+    session.close()
+    transacao.rollback()  # Reverter qualquer mudança após o teste
+    connection.close()
+
+
+@pytest.fixture(scope="function")
+def sql_capture(db_session):
+    """
+    Lista de (statement, parameters) de todo SQL emitido pela sessão do teste.
+    Útil para verificar o formato das queries (GROUP BY, uso de índice etc.).
+    """
+    conexao = db_session.connection()
+    capturadas = []
+    
+    def capturar(conn, cursor, statement, parameters, context, executemany):
+        capturadas.append((statement, parameters))
+    
+    event.listen(conexao, "before_cursor_execute", capturar)
+    yield capturadas
+    event.remove(conexao, "before_cursor_execute", capturar)
@@ -0,0 +1,125 @@
+"""
+Factories de dados para testes (factory_boy)
+
+Objetivo: Popular o banco de testes sem passar pela API.
+Nota: criar_em_lote monta as linhas como dicts e persiste todas com um único
+executemany, em vez de um INSERT/flush por objeto como o create_batch padrão.
+"""
+from datetime import date, datetime
+from typing import Union
+
+import factory
+from factory.alchemy import SQLAlchemyModelFactory
+from sqlmodel import insert
+
+from app.infrastructure.database.models.transacao_model import TransacaoModel
+from app.infrastructure.database.models.tag_model import TagModel, TransacaoTagModel
+from app.infrastructure.database.models.regra_model import RegraModel, RegraTagModel
+
+# Timestamp único para todas as linhas geradas (evita datetime.now() por linha)
+AGORA = datetime.now()
+
+
+class BulkSQLModelFactory(SQLAlchemyModelFactory):
+    """Base com criação em lote via session.execute(insert(Model), linhas)"""
+
+    class Meta:
+        abstract = True
+        sqlalchemy_session_persistence = None  # persistência fica a cargo de criar_em_lote
+
+    @classmethod
+    def linha(cls, **kwargs) -> dict:
+        """Monta uma linha (dict) com os defaults da factory"""
+        return vars(cls.stub(**kwargs))
+
+    @classmethod
+    def criar_em_lote(cls, session, specs: Union[int, list[dict]], **comuns) -> list[dict]:
+        """
+        Insere as linhas com um único executemany e faz commit.
+
+        `specs` é a quantidade de linhas (só defaults) ou uma lista de kwargs,
+        um dict por linha; `comuns` valem para todas as linhas.
+
+        Retorna as linhas inseridas. Em tabelas com `id` gerado pelo banco, cada
+        linha já vem com o `id`; tabelas de associação (chave composta) não têm.
+        """
+        if isinstance(specs, int):
+            specs = [{}] * specs
+        linhas = [cls.linha(**{**comuns, **spec}) for spec in specs]
+        modelo = cls._meta.model
+
+        if "id" in modelo.__table__.c:
+            ids = session.scalars(
+                insert(modelo).returning(modelo.id, sort_by_parameter_order=True),
+                linhas
+            ).all()
+            for linha, id_gerado in zip(linhas, ids):
+                linha["id"] = id_gerado
+        else:
+            session.execute(insert(modelo), linhas)
+
+        session.commit()
+        return linhas
+
+
+class TransacaoFactory(BulkSQLModelFactory):
+    """Transação de saída manual"""
+
+    class Meta:
+        model = TransacaoModel
+
+    data = date(2024, 1, 15)
+    descricao = factory.Sequence(lambda n: f"Transacao {n}")
+    valor = 100.0
+    valor_original = factory.SelfAttribute("valor")
+    tipo = "SAIDA"  # UPPERCASE, como gravado pelo repositório
+    categoria = None
+    origem = "manual"
+    criado_em = AGORA
+    atualizado_em = AGORA
+
+
+class TagFactory(BulkSQLModelFactory):
+    """Tag sem cor nem descrição"""
+
+    class Meta:
+        model = TagModel
+
+    nome = factory.Sequence(lambda n: f"Tag {n}")
+    cor = None
+    descricao = None
+    criado_em = AGORA
+    atualizado_em = AGORA
+
+
+class RegraFactory(BulkSQLModelFactory):
+    """Regra ativa de alterar categoria por descrição"""
+
+    class Meta:
+        model = RegraModel
+
+    nome = factory.Sequence(lambda n: f"Regra {n}")
+    tipo_acao = "ALTERAR_CATEGORIA"
+    criterio_tipo = "DESCRICAO_CONTEM"
+    criterio_valor = factory.Sequence(lambda n: f"criterio{n}")
+    acao_valor = "Categoria"
+    prioridade = factory.Sequence(lambda n: n + 1)
+    ativo = True
+    criado_em = AGORA
+    atualizado_em = AGORA
+
+
+class TransacaoTagFactory(BulkSQLModelFactory):
+    """Associação transação ↔ tag (informar transacao_id e tag_id)"""
+
+    class Meta:
+        model = TransacaoTagModel
+
+    criado_em = AGORA
+
+
+class RegraTagFactory(BulkSQLModelFactory):
+    """Associação regra ↔ tag (informar regra_id e tag_id)"""
+
+    class Meta:
+        model = RegraTagModel
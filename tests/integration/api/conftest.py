@@ -0,0 +1,38 @@
+"""
+Fixtures compartilhadas pelos testes de API
+
+Objetivo: Um único ponto de configuração do TestClient sobre o banco em memória
+(test_engine, de tests/conftest.py), expondo também a sessão para que os testes
+possam popular dados diretamente no banco (sem passar pela camada HTTP).
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.infrastructure.database.session import get_session
+
+
+@pytest.fixture(scope="session")
+def http_client():
+    """TestClient criado uma única vez para toda a suíte"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def session(db_session):
+    """Sessão usada pela API no teste (para popular dados em massa)"""
+    return db_session
+
+
+@pytest.fixture(scope="function")
+def client(http_client, session):
+    """Cliente de teste FastAPI com banco em memória, revertido ao fim de cada teste"""
+    def override_get_session():
+        yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+
+    yield http_client
+
+    app.dependency_overrides.clear()
@@ -5,45 +5,6 @@ Objetivo: Testar endpoints da API usando TestClient do FastAPI
 Nota: Usa banco de dados em memória (SQLite)
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy.pool import StaticPool
-
-
-@pytest.fixture(scope="function")
-def client():
-    """Cliente de teste FastAPI com banco em memória"""
-    # Importar modelos
-    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa
-    from app.infrastructure.database.models.tag_model import TagModel  # noqa
-    from app.infrastructure.database.models.regra_model import RegraModel  # noqa
-    from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa
-    
-    # Criar engine em memória
-    test_engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    
-    # Criar tabelas
-    SQLModel.metadata.create_all(test_engine)
-    
-    # Override do engine
-    def override_get_session():
-        with Session(test_engine) as session:
-            yield session
-    
-    from app.infrastructure.database.session import get_session
-    app.dependency_overrides[get_session] = override_get_session
-    
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    # Limpar
-    SQLModel.metadata.drop_all(test_engine)
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.integration
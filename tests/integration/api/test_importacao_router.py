@@ -1,48 +1,38 @@
 """
 Testes de API para o router de importação
 """
+import csv
 import pytest
-from fastapi.testclient import TestClient
-from io import BytesIO
+from io import StringIO
 
-from app.main import app
-from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy.pool import StaticPool
 
+def _csv_bytes(cabecalho, linhas) -> bytes:
+    """Serializa um CSV com o módulo csv (aspas e escapes corretos)"""
+    buffer = StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(cabecalho)
+    writer.writerows(linhas)
+    return buffer.getvalue().encode('utf-8')
 
-@pytest.fixture(scope="function")
-def client():
-    """Cliente de teste FastAPI com banco em memória"""
-    # Importar modelos
-    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa
-    from app.infrastructure.database.models.tag_model import TagModel  # noqa
-    from app.infrastructure.database.models.regra_model import RegraModel  # noqa
-    from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa
-    
-    # Criar engine em memória
-    test_engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    
-    # Criar tabelas
-    SQLModel.metadata.create_all(test_engine)
-    
-    # Override do engine
-    def override_get_session():
-        with Session(test_engine) as session:
-            yield session
-    
-    from app.infrastructure.database.session import get_session
-    app.dependency_overrides[get_session] = override_get_session
-    
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    # Limpar
-    SQLModel.metadata.drop_all(test_engine)
-    app.dependency_overrides.clear()
+
+# Payloads reutilizados, codificados uma única vez no import do módulo
+# (o TestClient aceita bytes direto em files=, sem BytesIO)
+EXTRATO_CSV_BYTES = _csv_bytes(
+    ["data", "descricao", "valor"],
+    [
+        ["15/01/2024", "Salário", "5000.00"],
+        ["16/01/2024", "Supermercado", "-150.50"],
+        ["17/01/2024", "Restaurante", "-80.00"],
+    ]
+)
+FATURA_CSV_BYTES = _csv_bytes(
+    ["data", "descricao", "valor"],
+    [
+        ["15/01/2024", "Netflix", "39.90"],
+        ["16/01/2024", "Uber", "25.00"],
+        ["17/01/2024", "iFood", "45.50"],
+    ]
+)
 
 
 class TestImportacaoRouter:
@@ -50,14 +40,7 @@ class TestImportacaoRouter:
     
     def test_importar_extrato_csv_valido(self, client):
         """Deve importar extrato bancário CSV válido"""
-        # Criar CSV válido
-        csv_content = """data,descricao,valor
-15/01/2024,Salário,5000.00
-16/01/2024,Supermercado,-150.50
-17/01/2024,Restaurante,-80.00"""
-        
-        # Criar arquivo
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = EXTRATO_CSV_BYTES
         
         # Importar
         response = client.post(
@@ -73,11 +56,13 @@ class TestImportacaoRouter:
     
     def test_importar_extrato_csv_com_categoria(self, client):
         """Deve importar extrato CSV com categoria"""
-        csv_content = """data,descricao,valor,categoria
-15/01/2024,Salário,5000.00,Renda
-16/01/2024,Supermercado,-150.50,Alimentação"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(
+            ["data", "descricao", "valor", "categoria"],
+            [
+                ["15/01/2024", "Salário", "5000.00", "Renda"],
+                ["16/01/2024", "Supermercado", "-150.50", "Alimentação"],
+            ]
+        )
         
         response = client.post(
             "/importacao/extrato",
@@ -95,9 +80,7 @@ class TestImportacaoRouter:
     
     def test_importar_extrato_csv_vazio(self, client):
         """Deve importar 0 transações de CSV vazio (comportamento tolerante)"""
-        csv_content = """data,descricao,valor"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(["data", "descricao", "valor"], [])
         
         response = client.post(
             "/importacao/extrato",
@@ -111,10 +94,12 @@ class TestImportacaoRouter:
     def test_importar_extrato_csv_sem_colunas_obrigatorias(self, client):
         """Deve retornar erro se faltar colunas obrigatórias"""
         # Falta coluna 'valor'
-        csv_content = """data,descricao
-15/01/2024,Compra"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(
+            ["data", "descricao"],
+            [
+                ["15/01/2024", "Compra"],
+            ]
+        )
         
         response = client.post(
             "/importacao/extrato",
@@ -126,11 +111,13 @@ class TestImportacaoRouter:
     
     def test_importar_extrato_csv_com_data_invalida(self, client):
         """Deve ignorar linhas com data inválida (comportamento tolerante)"""
-        csv_content = """data,descricao,valor
-99/99/9999,Compra Inválida,100.00
-15/01/2024,Compra Válida,50.00"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(
+            ["data", "descricao", "valor"],
+            [
+                ["99/99/9999", "Compra Inválida", "100.00"],
+                ["15/01/2024", "Compra Válida", "50.00"],
+            ]
+        )
         
         response = client.post(
             "/importacao/extrato",
@@ -142,14 +129,29 @@ class TestImportacaoRouter:
         data = response.json()
         assert data["total_importado"] == 1
     
+    def test_importar_extrato_com_linhas_invalidas_no_meio(self, client):
+        """Deve ignorar linhas inválidas intercaladas e importar as demais"""
+        # Montar o payload direto em bytes (sem concatenar str e codificar no final)
+        conteudo = bytearray(b"data,descricao,valor,categoria\n")
+        for i in range(20):
+            if i % 5 == 0:
+                conteudo += b"invalid,invalid,invalid,invalid\n"
+            else:
+                conteudo += b"2025-12-15,Transacao %d,100.0,Categoria\n" % i
+        
+        response = client.post(
+            "/importacao/extrato",
+            files={"arquivo": ("extrato.csv", bytes(conteudo), "text/csv")}
+        )
+        
+        # 4 linhas inválidas (i = 0, 5, 10, 15) são ignoradas
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_importado"] == 16
+    
     def test_importar_fatura_csv_valida(self, client):
         """Deve importar fatura de cartão CSV válida"""
-        csv_content = """data,descricao,valor
-15/01/2024,Netflix,39.90
-16/01/2024,Uber,25.00
-17/01/2024,iFood,45.50"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = FATURA_CSV_BYTES
         
         response = client.post(
             "/importacao/fatura",
@@ -168,11 +170,13 @@ class TestImportacaoRouter:
     
     def test_importar_fatura_com_valores_negativos(self, client):
         """Deve converter valores negativos para positivos em fatura"""
-        csv_content = """data,descricao,valor
-15/01/2024,Compra,-100.00
-16/01/2024,Serviço,-50.00"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(
+            ["data", "descricao", "valor"],
+            [
+                ["15/01/2024", "Compra", "-100.00"],
+                ["16/01/2024", "Serviço", "-50.00"],
+            ]
+        )
         
         response = client.post(
             "/importacao/fatura",
@@ -191,11 +195,13 @@ class TestImportacaoRouter:
     
     def test_importar_fatura_com_data_fatura(self, client):
         """Deve importar fatura com data de fechamento"""
-        csv_content = """data,descricao,valor,data_fatura
-15/01/2024,Netflix,39.90,05/02/2024
-16/01/2024,Spotify,19.90,05/02/2024"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(
+            ["data", "descricao", "valor", "data_fatura"],
+            [
+                ["15/01/2024", "Netflix", "39.90", "05/02/2024"],
+                ["16/01/2024", "Spotify", "19.90", "05/02/2024"],
+            ]
+        )
         
         response = client.post(
             "/importacao/fatura",
@@ -209,8 +215,7 @@ class TestImportacaoRouter:
     def test_importar_arquivo_nao_csv(self, client):
         """Deve retornar erro para arquivo não CSV/Excel"""
         # Arquivo de texto simples
-        content = "Este não é um CSV válido sem vírgulas"
-        arquivo = BytesIO(content.encode('utf-8'))
+        arquivo = "Este não é um CSV válido sem vírgulas".encode('utf-8')
         
         response = client.post(
             "/importacao/extrato",
@@ -233,10 +238,12 @@ class TestImportacaoRouter:
         })
         
         # Importar extrato com transação que combina com regra
-        csv_content = """data,descricao,valor
-15/01/2024,Salário do mês,5000.00"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(
+            ["data", "descricao", "valor"],
+            [
+                ["15/01/2024", "Salário do mês", "5000.00"],
+            ]
+        )
         
         response = client.post(
             "/importacao/extrato",
@@ -252,11 +259,13 @@ class TestImportacaoRouter:
     
     def test_importar_extrato_formato_data_alternativo(self, client):
         """Deve aceitar formato de data YYYY-MM-DD"""
-        csv_content = """data,descricao,valor
-2024-01-15,Compra,100.00
-2024-01-16,Venda,200.00"""
-        
-        arquivo = BytesIO(csv_content.encode('utf-8'))
+        arquivo = _csv_bytes(
+            ["data", "descricao", "valor"],
+            [
+                ["2024-01-15", "Compra", "100.00"],
+                ["2024-01-16", "Venda", "200.00"],
+            ]
+        )
         
         response = client.post(
             "/importacao/extrato",
@@ -2,46 +2,10 @@
 Testes de API para o router de regras
 """
 import pytest
-from fastapi.testclient import TestClient
+from sqlmodel import select, func
 
-from app.main import app
-from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy.pool import StaticPool
-
-
-@pytest.fixture(scope="function")
-def client():
-    """Cliente de teste FastAPI com banco em memória"""
-    # Importar modelos
-    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa
-    from app.infrastructure.database.models.tag_model import TagModel  # noqa
-    from app.infrastructure.database.models.regra_model import RegraModel  # noqa
-    from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa
-    
-    # Criar engine em memória
-    test_engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    
-    # Criar tabelas
-    SQLModel.metadata.create_all(test_engine)
-    
-    # Override do engine
-    def override_get_session():
-        with Session(test_engine) as session:
-            yield session
-    
-    from app.infrastructure.database.session import get_session
-    app.dependency_overrides[get_session] = override_get_session
-    
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    # Limpar
-    SQLModel.metadata.drop_all(test_engine)
-    app.dependency_overrides.clear()
+from app.infrastructure.database.models.regra_model import RegraTagModel
+from tests.factories import RegraFactory, RegraTagFactory, TagFactory
 
 
 class TestRegrasRouter:
@@ -64,25 +28,10 @@ class TestRegrasRouter:
         assert data["nome"] == "Regra Teste"
         assert data["criterio_tipo"] == "descricao_contem"
     
-    def test_listar_regras(self, client):
+    def test_listar_regras(self, client, session):
         """Deve listar regras ordenadas"""
-        # Criar regras
-        client.post("/regras", json={
-            "nome": "Regra 1",
-            "tipo_acao": "alterar_categoria",
-            "criterio_tipo": "descricao_contem",
-            "criterio_valor": "teste1",
-            "acao_valor": "Cat1",
-            "prioridade": 100
-        })
-        client.post("/regras", json={
-            "nome": "Regra 2",
-            "tipo_acao": "alterar_categoria",
-            "criterio_tipo": "descricao_contem",
-            "criterio_valor": "teste2",
-            "acao_valor": "Cat2",
-            "prioridade": 50
-        })
+        # Criar regras direto no banco (criação via API coberta em test_criar_regra)
+        RegraFactory.criar_em_lote(session, 2)
         
         response = client.get("/regras")
         
@@ -93,18 +42,27 @@ class TestRegrasRouter:
         prioridades = [r["prioridade"] for r in data]
         assert prioridades == sorted(prioridades, reverse=True)
     
-    def test_obter_regra_por_id(self, client):
-        """Deve obter uma regra por ID"""
-        # Criar regra
-        create_response = client.post("/regras", json={
-            "nome": "Regra Obter",
+    def test_prioridade_auto_incrementa(self, client, session):
+        """Deve usar prioridade máxima + 1 quando a prioridade não é informada"""
+        # Criar 5 regras (prioridades 1 a 5) em um único commit
+        RegraFactory.criar_em_lote(session, [{"prioridade": i + 1} for i in range(5)])
+        
+        # Apenas a criação sob teste passa pela API
+        response = client.post("/regras", json={
+            "nome": "Regra Sem Prioridade",
             "tipo_acao": "alterar_categoria",
             "criterio_tipo": "descricao_contem",
-            "criterio_valor": "teste",
-            "acao_valor": "Teste",
-            "prioridade": 100
+            "criterio_valor": "mercado",
+            "acao_valor": "Alimentação"
         })
-        regra_id = create_response.json()["id"]
+        
+        assert response.status_code == 201
+        assert response.json()["prioridade"] == 6
+    
+    def test_obter_regra_por_id(self, client, session):
+        """Deve obter uma regra por ID"""
+        # Criar regra direto no banco
+        regra_id = RegraFactory.criar_em_lote(session, 1, nome="Regra Obter")[0]["id"]
         
         # Obter regra
         response = client.get(f"/regras/{regra_id}")
@@ -120,18 +78,12 @@ class TestRegrasRouter:
         
         assert response.status_code == 404
     
-    def test_atualizar_regra(self, client):
+    def test_atualizar_regra(self, client, session):
         """Deve atualizar uma regra"""
-        # Criar regra
-        create_response = client.post("/regras", json={
-            "nome": "Regra Original",
-            "tipo_acao": "alterar_categoria",
-            "criterio_tipo": "descricao_contem",
-            "criterio_valor": "teste",
-            "acao_valor": "Original",
-            "prioridade": 100
-        })
-        regra_id = create_response.json()["id"]
+        # Criar regra direto no banco
+        regra_id = RegraFactory.criar_em_lote(
+            session, 1, nome="Regra Original", acao_valor="Original"
+        )[0]["id"]
         
         # Atualizar regra
         response = client.patch(f"/regras/{regra_id}", json={
@@ -144,18 +96,10 @@ class TestRegrasRouter:
         assert data["nome"] == "Regra Atualizada"
         assert data["acao_valor"] == "Atualizada"
     
-    def test_deletar_regra(self, client):
+    def test_deletar_regra(self, client, session):
         """Deve deletar uma regra"""
-        # Criar regra
-        create_response = client.post("/regras", json={
-            "nome": "Regra Deletar",
-            "tipo_acao": "alterar_categoria",
-            "criterio_tipo": "descricao_contem",
-            "criterio_valor": "teste",
-            "acao_valor": "Teste",
-            "prioridade": 100
-        })
-        regra_id = create_response.json()["id"]
+        # Criar regra direto no banco
+        regra_id = RegraFactory.criar_em_lote(session, 1, nome="Regra Deletar")[0]["id"]
         
         # Deletar regra
         response = client.delete(f"/regras/{regra_id}")
@@ -165,3 +109,22 @@ class TestRegrasRouter:
         # Verificar que foi deletada
         get_response = client.get(f"/regras/{regra_id}")
         assert get_response.status_code == 404
+    
+    def test_deletar_regra_remove_associacoes_tags(self, client, session):
+        """Deve remover as associações regra ↔ tag ao deletar a regra"""
+        # Criar regra, tag e associação direto no banco
+        regra_id = RegraFactory.criar_em_lote(
+            session, 1, nome="Regra Com Tag", tipo_acao="ADICIONAR_TAGS"
+        )[0]["id"]
+        tag_id = TagFactory.criar_em_lote(session, 1, nome="Tag da Regra")[0]["id"]
+        RegraTagFactory.criar_em_lote(session, 1, regra_id=regra_id, tag_id=tag_id)
+        
+        response = client.delete(f"/regras/{regra_id}")
+        
+        assert response.status_code == 204
+        total = session.scalar(
+            select(func.count()).select_from(RegraTagModel).where(
+                RegraTagModel.regra_id == regra_id
+            )
+        )
+        assert total == 0
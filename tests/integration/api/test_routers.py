@@ -2,47 +2,11 @@
 Testes de API Routers
 """
 import pytest
-from fastapi.testclient import TestClient
 from datetime import datetime, date
+from sqlmodel import select, func
 
-from app.main import app
-from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy.pool import StaticPool
-
-
-@pytest.fixture(scope="function")
-def client():
-    """Cliente de teste FastAPI com banco em memória"""
-    # Importar modelos
-    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa
-    from app.infrastructure.database.models.tag_model import TagModel  # noqa
-    from app.infrastructure.database.models.regra_model import RegraModel  # noqa
-    from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa
-    
-    # Criar engine em memória
-    test_engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    
-    # Criar tabelas
-    SQLModel.metadata.create_all(test_engine)
-    
-    # Override do engine
-    def override_get_session():
-        with Session(test_engine) as session:
-            yield session
-    
-    from app.infrastructure.database.session import get_session
-    app.dependency_overrides[get_session] = override_get_session
-    
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    # Limpar
-    SQLModel.metadata.drop_all(test_engine)
-    app.dependency_overrides.clear()
+from app.infrastructure.database.models.tag_model import TransacaoTagModel
+from tests.factories import TagFactory, TransacaoFactory, TransacaoTagFactory
 
 
 class TestTagsRouter:
@@ -62,19 +26,18 @@ class TestTagsRouter:
         assert data["cor"] == "#FF0000"
         assert "id" in data
     
-    def test_listar_tags(self, client):
+    def test_listar_tags(self, client, session):
         """Deve listar todas as tags"""
-        # Criar algumas tags
-        client.post("/tags", json={"nome": "Tag 1", "cor": "#FF0000"})
-        client.post("/tags", json={"nome": "Tag 2", "cor": "#00FF00"})
+        # Criar algumas tags direto no banco (criação via API coberta em test_criar_tag)
+        tags = TagFactory.criar_em_lote(session, 2)
         
         response = client.get("/tags")
         
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 2
-        assert any(t["nome"] == "Tag 1" for t in data)
-        assert any(t["nome"] == "Tag 2" for t in data)
+        nomes = {t["nome"] for t in data}
+        assert all(tag["nome"] in nomes for tag in tags)
     
     def test_obter_tag_por_id(self, client):
         """Deve obter uma tag por ID"""
@@ -142,6 +105,28 @@ class TestTagsRouter:
         get_response = client.get(f"/tags/{tag_id}")
         assert get_response.status_code == 404
 
+    def test_deletar_tag_em_uso_por_multiplas_transacoes(self, client, session):
+        """Deve deletar tag em uso e remover todas as suas associações"""
+        # Criar tag, 100 transações e as associações direto no banco
+        tag_id = TagFactory.criar_em_lote(session, 1)[0]["id"]
+        transacoes = TransacaoFactory.criar_em_lote(session, 100)
+        TransacaoTagFactory.criar_em_lote(
+            session, [{"transacao_id": t["id"]} for t in transacoes], tag_id=tag_id
+        )
+        
+        # Deletar tag
+        response = client.delete(f"/tags/{tag_id}")
+        
+        assert response.status_code == 204
+        
+        # Verificar direto no banco que nenhuma associação sobrou
+        total = session.scalar(
+            select(func.count()).select_from(TransacaoTagModel).where(
+                TransacaoTagModel.tag_id == tag_id
+            )
+        )
+        assert total == 0
+
 
 class TestConfiguracoesRouter:
     """Testes para o router de configurações"""
@@ -332,6 +317,26 @@ class TestTransacoesRouter:
         get_response = client.get(f"/transacoes/{transacao_id}")
         assert get_response.status_code == 404
     
+    def test_deletar_transacao_remove_associacoes_tags(self, client, session):
+        """Deve remover as associações com tags ao deletar a transação"""
+        # Criar tag, transação e associação direto no banco
+        tag_id = TagFactory.criar_em_lote(session, 1)[0]["id"]
+        transacao_id = TransacaoFactory.criar_em_lote(session, 1)[0]["id"]
+        TransacaoTagFactory.criar_em_lote(session, 1, transacao_id=transacao_id, tag_id=tag_id)
+        
+        # Deletar transação
+        response = client.delete(f"/transacoes/{transacao_id}")
+        
+        assert response.status_code == 204
+        
+        # Verificar direto no banco que a associação foi removida
+        total = session.scalar(
+            select(func.count()).select_from(TransacaoTagModel).where(
+                TransacaoTagModel.transacao_id == transacao_id
+            )
+        )
+        assert total == 0
+    
     def test_listar_categorias(self, client):
         """Deve listar categorias únicas"""
         # Criar transações com categorias
@@ -3,67 +3,24 @@ Testes adicionais de API para o router de transações
 Foca em endpoints não cobertos: filtros, resumo mensal, tags
 """
 import pytest
-from fastapi.testclient import TestClient
+from datetime import date
+from sqlmodel import select, func
 
-from app.main import app
-from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy.pool import StaticPool
-
-
-@pytest.fixture(scope="function")
-def client():
-    """Cliente de teste FastAPI com banco em memória"""
-    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa
-    from app.infrastructure.database.models.tag_model import TagModel  # noqa
-    from app.infrastructure.database.models.regra_model import RegraModel  # noqa
-    from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa
-    
-    test_engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    
-    SQLModel.metadata.create_all(test_engine)
-    
-    def override_get_session():
-        with Session(test_engine) as session:
-            yield session
-    
-    from app.infrastructure.database.session import get_session
-    app.dependency_overrides[get_session] = override_get_session
-    
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    SQLModel.metadata.drop_all(test_engine)
-    app.dependency_overrides.clear()
+from app.infrastructure.database.models.tag_model import TransacaoTagModel
+from tests.factories import TransacaoFactory, TagFactory
 
 
 class TestTransacoesRouterAvancado:
     """Testes avançados para endpoints de transações"""
     
-    def test_listar_transacoes_com_filtro_data(self, client):
+    def test_listar_transacoes_com_filtro_data(self, client, session):
         """Deve filtrar transações por data_inicio e data_fim"""
-        # Criar transações em diferentes datas
-        client.post("/transacoes", json={
-            "data": "2024-01-15",
-            "descricao": "Jan",
-            "valor": 100.0,
-            "tipo": "saida"
-        })
-        client.post("/transacoes", json={
-            "data": "2024-02-15",
-            "descricao": "Fev",
-            "valor": 200.0,
-            "tipo": "saida"
-        })
-        client.post("/transacoes", json={
-            "data": "2024-03-15",
-            "descricao": "Mar",
-            "valor": 300.0,
-            "tipo": "saida"
-        })
+        # Criar transações em diferentes datas (um único INSERT direto no banco)
+        TransacaoFactory.criar_em_lote(session, [
+            {"data": date(2024, 1, 15), "descricao": "Jan", "valor": 100.0},
+            {"data": date(2024, 2, 15), "descricao": "Fev", "valor": 200.0},
+            {"data": date(2024, 3, 15), "descricao": "Mar", "valor": 300.0},
+        ])
         
         # Filtrar apenas fevereiro
         response = client.get("/transacoes", params={
@@ -76,23 +33,13 @@ class TestTransacoesRouterAvancado:
         assert len(transacoes) == 1
         assert transacoes[0]["descricao"] == "Fev"
     
-    def test_listar_transacoes_com_filtro_categoria(self, client):
+    def test_listar_transacoes_com_filtro_categoria(self, client, session):
         """Deve filtrar transações por categoria"""
-        # Criar transações com categorias diferentes
-        client.post("/transacoes", json={
-            "data": "2024-01-15",
-            "descricao": "Supermercado",
-            "valor": 100.0,
-            "tipo": "saida",
-            "categoria": "Alimentação"
-        })
-        client.post("/transacoes", json={
-            "data": "2024-01-16",
-            "descricao": "Uber",
-            "valor": 50.0,
-            "tipo": "saida",
-            "categoria": "Transporte"
-        })
+        # Criar transações com categorias diferentes (um único INSERT direto no banco)
+        TransacaoFactory.criar_em_lote(session, [
+            {"data": date(2024, 1, 15), "descricao": "Supermercado", "valor": 100.0, "categoria": "Alimentação"},
+            {"data": date(2024, 1, 16), "descricao": "Uber", "valor": 50.0, "categoria": "Transporte"},
+        ])
         
         # Filtrar por categoria
         response = client.get("/transacoes", params={
@@ -104,22 +51,13 @@ class TestTransacoesRouterAvancado:
         assert len(transacoes) == 1
         assert transacoes[0]["categoria"] == "Alimentação"
     
-    def test_resumo_mensal_com_mes_ano(self, client):
+    def test_resumo_mensal_com_mes_ano(self, client, session):
         """Deve obter resumo mensal por mês e ano"""
-        # Criar transações em janeiro
-        client.post("/transacoes", json={
-            "data": "2024-01-15",
-            "descricao": "Salário",
-            "valor": 5000.0,
-            "tipo": "entrada"
-        })
-        client.post("/transacoes", json={
-            "data": "2024-01-20",
-            "descricao": "Aluguel",
-            "valor": 1500.0,
-            "tipo": "saida",
-            "categoria": "Moradia"
-        })
+        # Criar transações em janeiro (um único INSERT direto no banco)
+        TransacaoFactory.criar_em_lote(session, [
+            {"data": date(2024, 1, 15), "descricao": "Salário", "valor": 5000.0, "tipo": "ENTRADA"},
+            {"data": date(2024, 1, 20), "descricao": "Aluguel", "valor": 1500.0, "categoria": "Moradia"},
+        ])
         
         # Obter resumo de janeiro/2024
         response = client.get("/transacoes/resumo/mensal", params={
@@ -135,21 +73,30 @@ class TestTransacoesRouterAvancado:
         assert resumo["total_saidas"] == 1500.0
         assert resumo["saldo"] == 3500.0
     
-    def test_resumo_mensal_com_data_customizada(self, client):
+    def test_resumo_mensal_agrupa_por_categoria_no_banco(self, client, session, sql_capture):
+        """Deve somar por categoria com GROUP BY, sem carregar as transações"""
+        TransacaoFactory.criar_em_lote(session, [
+            {"data": date(2024, 3, 5), "valor": 100.0, "categoria": "Alimentação"},
+            {"data": date(2024, 3, 6), "valor": 50.0, "categoria": "Alimentação"},
+            {"data": date(2024, 3, 7), "valor": 30.0, "categoria": "Transporte"},
+        ])
+        sql_capture.clear()
+        
+        response = client.get("/transacoes/resumo/mensal", params={"mes": 3, "ano": 2024})
+        
+        assert response.status_code == 200
+        assert response.json()["saidas_por_categoria"] == {"Alimentação": 150.0, "Transporte": 30.0}
+        consultas_transacao = [sql for sql, _ in sql_capture if "FROM transacao" in sql]
+        assert consultas_transacao
+        assert all("GROUP BY" in sql for sql in consultas_transacao)
+    
+    def test_resumo_mensal_com_data_customizada(self, client, session):
         """Deve obter resumo com data_inicio e data_fim customizados"""
-        # Criar transações
-        client.post("/transacoes", json={
-            "data": "2024-01-25",
-            "descricao": "Entrada",
-            "valor": 1000.0,
-            "tipo": "entrada"
-        })
-        client.post("/transacoes", json={
-            "data": "2024-02-10",
-            "descricao": "Saída",
-            "valor": 500.0,
-            "tipo": "saida"
-        })
+        # Criar transações (um único INSERT direto no banco)
+        TransacaoFactory.criar_em_lote(session, [
+            {"data": date(2024, 1, 25), "descricao": "Entrada", "valor": 1000.0, "tipo": "ENTRADA"},
+            {"data": date(2024, 2, 10), "descricao": "Saída", "valor": 500.0},
+        ])
         
         # Resumo de 25/jan a 24/fev (período customizado)
         response = client.get("/transacoes/resumo/mensal", params={
@@ -191,6 +138,27 @@ class TestTransacoesRouterAvancado:
         assert len(tags) == 1
         assert tags[0]["nome"] == "Importante"
     
+    def test_adicionar_mesma_tag_duas_vezes_nao_duplica(self, client, session):
+        """Deve ser idempotente: repetir a associação não cria linha duplicada"""
+        # Criar tag e transação direto no banco
+        tag_id = TagFactory.criar_em_lote(session, 1, nome="Recorrente")[0]["id"]
+        transacao_id = TransacaoFactory.criar_em_lote(session, 1)[0]["id"]
+        
+        # Associar duas vezes (a segunda chamada verifica a idempotência)
+        primeira = client.post(f"/transacoes/{transacao_id}/tags/{tag_id}")
+        segunda = client.post(f"/transacoes/{transacao_id}/tags/{tag_id}")
+        
+        assert primeira.status_code == 204
+        assert segunda.status_code == 204
+        
+        # Verificar direto no banco que existe uma única associação
+        total = session.scalar(
+            select(func.count()).select_from(TransacaoTagModel).where(
+                TransacaoTagModel.transacao_id == transacao_id
+            )
+        )
+        assert total == 1
+    
     def test_remover_tag_de_transacao(self, client):
         """Deve remover tag de transação"""
         # Criar tag
@@ -302,14 +270,19 @@ class TestTransacoesRouterAvancado:
         client.post(f"/transacoes/{t2['id']}/tags/{tag1['id']}")
         client.post(f"/transacoes/{t2['id']}/tags/{tag2['id']}")
         
-        # Filtrar por tag1
-        response = client.get("/transacoes", params={
-            "tag_ids": f"{tag1['id']}"
+        # Filtrar por tag1 (ambas) e por tag2 (apenas T2)
+        response_tag1 = client.get("/transacoes", params={
+            "tags": f"{tag1['id']}"
+        })
+        response_tag2 = client.get("/transacoes", params={
+            "tags": f"{tag2['id']}"
         })
         
-        assert response.status_code == 200
-        transacoes = response.json()
-        assert len(transacoes) >= 2    
+        assert response_tag1.status_code == 200
+        assert sorted(t["descricao"] for t in response_tag1.json()) == ["T1", "T2"]
+        assert response_tag2.status_code == 200
+        assert [t["descricao"] for t in response_tag2.json()] == ["T2"]
+    
     def test_resumo_mensal_com_filtro_tags(self, client):
         """Deve filtrar resumo mensal por tags"""
         # Criar tags
@@ -3,9 +3,10 @@ Testes de integração para ConfiguracaoRepository
 Valida operações CRUD com banco de dados real
 """
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, select, func
 
 from app.domain.entities.configuracao import Configuracao
+from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel
 from app.infrastructure.database.repositories.configuracao_repository import ConfiguracaoRepository
 
 
@@ -131,9 +132,13 @@ class TestConfiguracaoRepositoryIntegration:
         # Act
         repository.salvar("unique_key", "valor2")
         
-        # Buscar todas configurações
-        all_configs = repository.listar_todas()
+        # Contar linhas com essa chave direto no banco (sem materializar a tabela)
+        total = db_session.scalar(
+            select(func.count()).select_from(ConfiguracaoModel).where(
+                ConfiguracaoModel.chave == "unique_key"
+            )
+        )
         
         # Assert - Deve existir apenas 1 configuração com essa chave
-        assert len(all_configs) == 1
-        assert all_configs["unique_key"] == "valor2"  # Valor atualizado
+        assert total == 1
+        assert repository.obter("unique_key") == "valor2"  # Valor atualizado
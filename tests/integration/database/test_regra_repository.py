@@ -7,6 +7,7 @@ from sqlmodel import Session
 
 from app.domain.entities.regra import Regra, CriterioTipo, TipoAcao
 from app.infrastructure.database.repositories.regra_repository import RegraRepository
+from tests.factories import RegraFactory
 
 
 @pytest.mark.integration
@@ -253,31 +254,10 @@ class TestRegraRepositoryIntegration:
         ACT: Obter próxima prioridade
         ASSERT: Retorna prioridade máxima + 1 (11)
         """
-        # Arrange
+        # Arrange - regras semeadas em lote direto no banco
         repository = RegraRepository(db_session)
         
-        regra1 = Regra(
-            nome="Regra 1",
-            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
-            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
-            criterio_valor="a",
-            acao_valor="A",
-            prioridade=5,
-            ativo=True
-        )
-        
-        regra2 = Regra(
-            nome="Regra 2",
-            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
-            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
-            criterio_valor="b",
-            acao_valor="B",
-            prioridade=10,
-            ativo=True
-        )
-        
-        repository.criar(regra1)
-        repository.criar(regra2)
+        RegraFactory.criar_em_lote(db_session, [{"prioridade": 5}, {"prioridade": 10}])
         
         # Act
         proxima_prioridade = repository.obter_proxima_prioridade()
@@ -69,6 +69,24 @@ class TestTagRepositoryIntegration:
         assert tag_encontrada is not None
         assert tag_encontrada.nome == "Transporte"
     
+    def test_buscar_por_nome_usa_indice_lower(self, db_session: Session, sql_capture):
+        """
+        ARRANGE: Captura do SQL emitido por buscar_por_nome
+        ACT: EXPLAIN QUERY PLAN da query capturada
+        ASSERT: Busca case-insensitive usa o índice de expressão lower(nome)
+        """
+        # Arrange
+        repository = TagRepository(db_session)
+        repository.buscar_por_nome("Rotina")
+        
+        # Act
+        statement, parameters = sql_capture[-1]
+        plano = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        detalhes = " ".join(linha[-1] for linha in plano)
+        
+        # Assert
+        assert "USING INDEX idx_tag_nome_lower_unique" in detalhes
+    
     def test_buscar_por_nome_inexistente_retorna_none(self, db_session: Session):
         """
         ARRANGE: Repositório sem a tag
@@ -195,11 +213,12 @@ class TestTagRepositoryIntegration:
         # Assert
         assert tag_buscada is None
     
-    def test_criar_tag_nome_duplicado_lanca_excecao(self, db_session: Session):
+    @pytest.mark.parametrize("nome_duplicado", ["Duplicada", "duplicada", "DUPLICADA"])
+    def test_criar_tag_nome_duplicado_lanca_excecao(self, db_session: Session, nome_duplicado: str):
         """
         ARRANGE: Tag com nome já existente
-        ACT: Tentar criar tag duplicada
-        ASSERT: Lança IntegrityError
+        ACT: Tentar criar tag com o mesmo nome (qualquer caixa)
+        ASSERT: Lança ValueError
         """
         # Arrange
         repository = TagRepository(db_session)
@@ -207,6 +226,6 @@ class TestTagRepositoryIntegration:
         repository.criar(tag1)
         
         # Act & Assert
-        tag2 = Tag(nome="Duplicada")
-        with pytest.raises(ValueError, match="Tag com nome 'Duplicada' já existe"):
+        tag2 = Tag(nome=nome_duplicado)
+        with pytest.raises(ValueError, match=f"Tag com nome '{nome_duplicado}' já existe"):
             repository.criar(tag2)
@@ -8,6 +8,7 @@ from sqlmodel import Session
 
 from app.domain.entities.transacao import Transacao, TipoTransacao
 from app.infrastructure.database.repositories.transacao_repository import TransacaoRepository
+from tests.factories import TagFactory
 
 
 @pytest.mark.integration
@@ -195,6 +196,75 @@ class TestTransacaoRepositoryIntegration:
         assert "Dentro do período" in descricoes
         assert "Fora do período" not in descricoes
     
+    def test_listar_com_filtro_periodo_inclui_data_fim(self, db_session: Session):
+        """
+        ARRANGE: Transação exatamente na data_fim
+        ACT: Filtrar por período
+        ASSERT: data_fim é inclusiva (limite exclusivo é o dia seguinte)
+        """
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        repository.criar(Transacao(
+            data=date(2025, 1, 31),
+            descricao="Último dia",
+            valor=10.00,
+            tipo=TipoTransacao.SAIDA,
+            origem="manual"
+        ))
+        
+        # Act
+        transacoes = repository.listar(
+            data_inicio=date(2025, 1, 1),
+            data_fim=date(2025, 1, 31)
+        )
+        
+        # Assert
+        assert [t.descricao for t in transacoes] == ["Último dia"]
+    
+    def test_listar_por_mes_exclui_primeiro_dia_do_mes_seguinte(self, db_session: Session):
+        """
+        ARRANGE: Transações no último dia do mês e no primeiro do mês seguinte
+        ACT: Listar e contar por mes/ano
+        ASSERT: Apenas a transação do mês é considerada
+        """
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        for data, descricao in [(date(2025, 1, 31), "Janeiro"), (date(2025, 2, 1), "Fevereiro")]:
+            repository.criar(Transacao(
+                data=data,
+                descricao=descricao,
+                valor=10.00,
+                tipo=TipoTransacao.SAIDA,
+                origem="manual"
+            ))
+        
+        # Act
+        transacoes = repository.listar(mes=1, ano=2025)
+        total = repository.contar(mes=1, ano=2025)
+        
+        # Assert
+        assert [t.descricao for t in transacoes] == ["Janeiro"]
+        assert total == 1
+    
+    def test_filtro_periodo_usa_indice_de_data(self, db_session: Session, sql_capture):
+        """
+        ARRANGE: Captura do SQL emitido pelo filtro de período
+        ACT: EXPLAIN QUERY PLAN da query capturada
+        ASSERT: Range scan pelo índice de data, sem funções sobre a coluna
+        """
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        repository.listar(data_inicio=date(2025, 1, 1), data_fim=date(2025, 1, 31))
+        
+        # Act
+        statement, parameters = sql_capture[-1]
+        plano = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        detalhes = " ".join(linha[-1] for linha in plano)
+        
+        # Assert
+        assert "strftime(" not in statement.lower()
+        assert "USING INDEX ix_transacao_data" in detalhes
+    
     def test_atualizar_transacao(self, db_session: Session):
         """
         ARRANGE: Transação existente
@@ -299,16 +369,50 @@ class TestTransacaoRepositoryIntegration:
         )
         
         transacao_criada = repository.criar(transacao)
+        tag1, tag2 = (linha["id"] for linha in TagFactory.criar_em_lote(db_session, 2))
         
         # Act
-        transacao_criada.adicionar_tag(1)
-        transacao_criada.adicionar_tag(2)
+        transacao_criada.adicionar_tag(tag1)
+        transacao_criada.adicionar_tag(tag2)
         repository.atualizar(transacao_criada)
         
         # Buscar novamente
         transacao_atualizada = repository.buscar_por_id(transacao_criada.id)
         
         # Assert
-        assert 1 in transacao_atualizada.tag_ids
-        assert 2 in transacao_atualizada.tag_ids
+        assert tag1 in transacao_atualizada.tag_ids
+        assert tag2 in transacao_atualizada.tag_ids
         assert len(transacao_atualizada.tag_ids) == 2
+    
+    def test_atualizar_substitui_tags_existentes(self, db_session: Session):
+        """
+        ARRANGE: Transação com duas tags
+        ACT: Remover a primeira, adicionar uma terceira e atualizar
+        ASSERT: Associações antigas são substituídas pelas novas
+        """
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        transacao = Transacao(
+            data=date(2025, 1, 15),
+            descricao="Test",
+            valor=100.00,
+            tipo=TipoTransacao.SAIDA,
+            origem="manual"
+        )
+        
+        transacao_criada = repository.criar(transacao)
+        tag1, tag2, tag3 = (linha["id"] for linha in TagFactory.criar_em_lote(db_session, 3))
+        transacao_criada.adicionar_tag(tag1)
+        transacao_criada.adicionar_tag(tag2)
+        transacao_criada = repository.atualizar(transacao_criada)
+        
+        # Act
+        transacao_criada.remover_tag(tag1)
+        transacao_criada.adicionar_tag(tag3)
+        repository.atualizar(transacao_criada)
+        
+        # Buscar novamente
+        transacao_atualizada = repository.buscar_por_id(transacao_criada.id)
+        
+        # Assert
+        assert sorted(transacao_atualizada.tag_ids) == sorted([tag2, tag3])
@@ -0,0 +1,60 @@
+"""
+Fixtures compartilhadas pelos testes unitários de casos de uso
+
+Os mocks de repositório são novos a cada teste (spec_set garante que só os
+métodos da interface existam). Classes que definem fixtures com o mesmo nome
+sobrepõem as daqui.
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from app.domain.entities.tag import Tag
+from app.domain.repositories.configuracao_repository import IConfiguracaoRepository
+from app.domain.repositories.regra_repository import IRegraRepository
+from app.domain.repositories.tag_repository import ITagRepository
+from app.domain.repositories.transacao_repository import ITransacaoRepository
+
+
+_TAG_ROTINA = Tag(nome="Rotina", cor="#4B5563")
+_TAG_ROTINA.id = 1
+
+
+@pytest.fixture
+def mock_transacao_repo():
+    """Mock do repositório de transações"""
+    return Mock(spec_set=ITransacaoRepository)
+
+
+@pytest.fixture
+def mock_tag_repo():
+    """Mock do repositório de tags"""
+    return Mock(spec_set=ITagRepository)
+
+
+@pytest.fixture
+def mock_regra_repo():
+    """Mock do repositório de regras"""
+    return Mock(spec_set=IRegraRepository)
+
+
+@pytest.fixture
+def mock_configuracao_repo():
+    """Mock do repositório de configurações"""
+    return Mock(spec_set=IConfiguracaoRepository)
+
+
+@pytest.fixture(scope="session")
+def tag_rotina():
+    """Tag Rotina padrão (instância compartilhada; os importadores só leem o id)"""
+    return _TAG_ROTINA
+
+
+@pytest.fixture
+def transacao_mock():
+    """Substituto leve de Transacao com id=1
+
+    Os importadores só leem o id e chamam adicionar_tag, sem que os testes
+    verifiquem essas chamadas; um SimpleNamespace basta e evita o custo de um Mock.
+    """
+    return SimpleNamespace(id=1, adicionar_tag=lambda tag_id: None)
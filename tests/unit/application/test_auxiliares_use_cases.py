@@ -2,8 +2,7 @@
 Testes para Use Cases Auxiliares
 """
 import pytest
-from unittest.mock import Mock
-from datetime import datetime, date
+from datetime import date
 
 from app.application.use_cases.aplicar_todas_regras import AplicarTodasRegrasUseCase
 from app.application.use_cases.listar_categorias import ListarCategoriasUseCase
@@ -14,17 +13,16 @@ from app.domain.value_objects.tipo_transacao import TipoTransacao
 from app.domain.value_objects.regra_enums import TipoAcao, CriterioTipo
 
 
+# Retornos do repositório para TestListarCategoriasUseCase (list() em cada teste mantém a mutabilidade)
+_CATEGORIAS_BASE = ("Transporte", "Alimentação", "Saúde", "Lazer")
+_CATEGORIAS_COM_NONE = ("Alimentação", None, "Transporte", None, "Saúde")
+_CATEGORIAS_COM_VAZIAS = ("Alimentação", "", "Transporte", "   ", "Saúde")
+_CATEGORIAS_UNICAS = ("Alimentação", "Transporte", "Saúde")
+
+
 class TestAplicarTodasRegrasUseCase:
     """Testes para AplicarTodasRegrasUseCase"""
     
-    @pytest.fixture
-    def mock_transacao_repo(self):
-        return Mock()
-    
-    @pytest.fixture
-    def mock_regra_repo(self):
-        return Mock()
-    
     @pytest.fixture
     def use_case(self, mock_transacao_repo, mock_regra_repo):
         return AplicarTodasRegrasUseCase(mock_transacao_repo, mock_regra_repo)
@@ -194,10 +192,6 @@ class TestAplicarTodasRegrasUseCase:
 class TestListarCategoriasUseCase:
     """Testes para ListarCategoriasUseCase"""
     
-    @pytest.fixture
-    def mock_transacao_repo(self):
-        return Mock()
-    
     @pytest.fixture
     def use_case(self, mock_transacao_repo):
         return ListarCategoriasUseCase(mock_transacao_repo)
@@ -205,8 +199,7 @@ class TestListarCategoriasUseCase:
     def test_listar_categorias_com_sucesso(self, use_case, mock_transacao_repo):
         """Deve listar categorias ordenadas alfabeticamente"""
         # Arrange
-        categorias = ["Transporte", "Alimentação", "Saúde", "Lazer"]
-        mock_transacao_repo.listar_categorias.return_value = categorias
+        mock_transacao_repo.listar_categorias.return_value = list(_CATEGORIAS_BASE)
         
         # Act
         result = use_case.execute()
@@ -218,8 +211,7 @@ class TestListarCategoriasUseCase:
     def test_filtrar_categorias_none(self, use_case, mock_transacao_repo):
         """Deve filtrar categorias None"""
         # Arrange
-        categorias = ["Alimentação", None, "Transporte", None, "Saúde"]
-        mock_transacao_repo.listar_categorias.return_value = categorias
+        mock_transacao_repo.listar_categorias.return_value = list(_CATEGORIAS_COM_NONE)
         
         # Act
         result = use_case.execute()
@@ -231,8 +223,7 @@ class TestListarCategoriasUseCase:
     def test_filtrar_categorias_vazias(self, use_case, mock_transacao_repo):
         """Deve filtrar categorias vazias"""
         # Arrange
-        categorias = ["Alimentação", "", "Transporte", "   ", "Saúde"]
-        mock_transacao_repo.listar_categorias.return_value = categorias
+        mock_transacao_repo.listar_categorias.return_value = list(_CATEGORIAS_COM_VAZIAS)
         
         # Act
         result = use_case.execute()
@@ -258,8 +249,7 @@ class TestListarCategoriasUseCase:
     def test_categorias_duplicadas_sao_preservadas(self, use_case, mock_transacao_repo):
         """Repositório já retorna categorias únicas, então duplicatas não aparecem"""
         # Arrange
-        categorias = ["Alimentação", "Transporte", "Saúde"]
-        mock_transacao_repo.listar_categorias.return_value = categorias
+        mock_transacao_repo.listar_categorias.return_value = list(_CATEGORIAS_UNICAS)
         
         # Act
         result = use_case.execute()
@@ -1,38 +1,117 @@
 """
 Testes unitários para Use Cases de Importação
 """
+import itertools
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, patch
 from datetime import date
 import pandas as pd
-from io import BytesIO
 
 from app.application.use_cases.importar_extrato import ImportarExtratoUseCase
 from app.application.use_cases.importar_fatura import ImportarFaturaUseCase
 from app.application.exceptions import ValidationException
-from app.domain.entities.transacao import Transacao
-from app.domain.entities.tag import Tag
 from app.domain.entities.regra import Regra
+from app.domain.entities.tag import Tag
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 
 
-class TestImportarExtratoUseCase:
-    """Testes para ImportarExtratoUseCase"""
-    
-    @pytest.fixture
-    def mock_transacao_repo(self):
-        """Mock do repositório de transações"""
-        return Mock()
+_ARQUIVO = b"conteudo"  # conteúdo ignorado: pd.read_csv/read_excel são patcheados
+_EXTRATO_CSV = "extrato.csv"
+_EXTRATO_XLSX = "extrato.xlsx"
+_FATURA_CSV = "fatura.csv"
+_SEM_REGRAS = ()  # imutável; os use cases apenas iteram sobre as regras
+
+# DataFrames de entrada compartilhados; os testes usam .copy(deep=False) porque
+# o use case reatribui df.columns ao normalizar os nomes das colunas
+_DF_SEM_DATA = pd.DataFrame({
+    'descricao': ['Compra 1'],
+    'valor': [100.0]
+})
+_DF_SEM_DESCRICAO = pd.DataFrame({
+    'data': ['01/01/2024'],
+    'valor': [100.0]
+})
+_DF_SEM_VALOR = pd.DataFrame({
+    'data': ['01/01/2024'],
+    'descricao': ['Compra 1']
+})
+_DF_EXTRATO_DUAS_LINHAS = pd.DataFrame({
+    'data': ['01/01/2024', '02/01/2024'],
+    'descricao': ['Salário', 'Supermercado'],
+    'valor': [5000.0, -150.0]
+})
+_DF_COMPRA = pd.DataFrame({
+    'data': ['01/01/2024'],
+    'descricao': ['Compra'],
+    'valor': [-100.0]
+})
+_DF_SALARIO = pd.DataFrame({
+    'data': ['01/01/2024'],
+    'descricao': ['Salário'],
+    'valor': [5000.0]
+})
+_DF_SUPERMERCADO = pd.DataFrame({
+    'data': ['01/01/2024'],
+    'descricao': ['Supermercado'],
+    'valor': [-150.0]
+})
+_DF_COMPRA_COM_CATEGORIA = pd.DataFrame({
+    'data': ['01/01/2024'],
+    'descricao': ['Compra'],
+    'valor': [-100.0],
+    'categoria': ['Alimentação']
+})
+_DF_FATURA_DUAS_LINHAS = pd.DataFrame({
+    'data': ['15/12/2024', '20/12/2024'],
+    'descricao': ['Restaurante', 'Gasolina'],
+    'valor': [85.50, 200.00]
+})
+_DF_FATURA_COMPRA = pd.DataFrame({
+    'data': ['15/12/2024'],
+    'descricao': ['Compra'],
+    'valor': [100.0]
+})
+_DF_FATURA_COMPRA_NEGATIVA = pd.DataFrame({
+    'data': ['15/12/2024'],
+    'descricao': ['Compra'],
+    'valor': [-100.0]
+})
+_DF_FATURA_COM_DATA_FATURA = pd.DataFrame({
+    'data': ['15/12/2024'],
+    'descricao': ['Compra'],
+    'valor': [100.0],
+    'data_fatura': ['05/01/2025']
+})
+_DF_FATURA_COLUNAS_DESNORMALIZADAS = pd.DataFrame({
+    'Data  ': ['15/12/2024'],
+    'DESCRICAO': ['Compra'],
+    ' Valor': [100.0]
+})
+
+
+def _simular_persistencia(mock_transacao_repo):
+    """criar atribui ids sequenciais (a partir de 1) e buscar_por_id devolve a transação criada"""
+    ids = itertools.count(1)
+    criadas = {}
     
-    @pytest.fixture
-    def mock_tag_repo(self):
-        """Mock do repositório de tags"""
-        return Mock()
+    def criar(transacao):
+        transacao.id = next(ids)
+        criadas[transacao.id] = transacao
+        return transacao
     
-    @pytest.fixture
-    def mock_regra_repo(self):
-        """Mock do repositório de regras"""
-        return Mock()
+    mock_transacao_repo.criar.side_effect = criar
+    mock_transacao_repo.buscar_por_id.side_effect = criadas.get
+
+
+def _assert_formato_nao_suportado(use_case, nome_arquivo: str):
+    """Verificação comum aos dois importadores para extensões não suportadas"""
+    with pytest.raises(ValidationException, match="Formato de arquivo não suportado"):
+        use_case.execute(_ARQUIVO, nome_arquivo)
+
+
+@pytest.mark.xdist_group(name="importacao")
+class TestImportarExtratoUseCase:
+    """Testes para ImportarExtratoUseCase"""
     
     @pytest.fixture
     def use_case(self, mock_transacao_repo, mock_tag_repo, mock_regra_repo):
@@ -44,120 +123,54 @@ class TestImportarExtratoUseCase:
         )
     
     @pytest.fixture
-    def tag_rotina(self):
-        """Tag Rotina padrão"""
-        tag = Tag(nome="Rotina", cor="#4B5563")
-        tag.id = 1
-        return tag
+    def mock_read_csv(self):
+        """pd.read_csv patcheado durante o teste"""
+        with patch('app.application.use_cases.importar_extrato.pd.read_csv') as mock:
+            yield mock
+    
+    @pytest.fixture
+    def mock_read_excel(self):
+        """pd.read_excel patcheado durante o teste"""
+        with patch('app.application.use_cases.importar_extrato.pd.read_excel') as mock:
+            yield mock
     
     def test_arquivo_formato_invalido_lanca_excecao(self, use_case):
         """Deve lançar ValidationException para formato não suportado"""
-        arquivo = b"conteudo"
-        nome_arquivo = "arquivo.txt"
-        
-        with pytest.raises(ValidationException) as exc_info:
-            use_case.execute(arquivo, nome_arquivo)
-        
-        assert "Formato de arquivo não suportado" in str(exc_info.value)
+        _assert_formato_nao_suportado(use_case, "arquivo.txt")
     
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
     def test_erro_ao_ler_csv_lanca_excecao(self, mock_read_csv, use_case):
         """Deve lançar ValidationException se erro ao ler CSV"""
         mock_read_csv.side_effect = Exception("Erro de leitura")
         
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        with pytest.raises(ValidationException) as exc_info:
-            use_case.execute(arquivo, nome_arquivo)
-        
-        assert "Erro ao ler arquivo" in str(exc_info.value)
+        with pytest.raises(ValidationException, match="Erro ao ler arquivo"):
+            use_case.execute(_ARQUIVO, _EXTRATO_CSV)
     
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_csv_sem_coluna_data_lanca_excecao(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo):
+    @pytest.mark.parametrize("df_entrada, coluna", [
+        (_DF_SEM_DATA, "data"),
+        (_DF_SEM_DESCRICAO, "descricao"),
+        (_DF_SEM_VALOR, "valor"),
+    ], ids=["sem_data", "sem_descricao", "sem_valor"])
+    def test_csv_sem_coluna_obrigatoria_lanca_excecao(self, df_entrada, coluna, mock_read_csv, use_case, tag_rotina, mock_tag_repo):
         """Deve lançar ValidationException se falta coluna obrigatória"""
-        # DataFrame sem coluna 'data'
-        df = pd.DataFrame({
-            'descricao': ['Compra 1'],
-            'valor': [100.0]
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = df_entrada.copy(deep=False)
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        with pytest.raises(ValidationException) as exc_info:
-            use_case.execute(arquivo, nome_arquivo)
-        
-        assert "Coluna 'data' não encontrada" in str(exc_info.value)
+        with pytest.raises(ValidationException, match=f"Coluna '{coluna}' não encontrada"):
+            use_case.execute(_ARQUIVO, _EXTRATO_CSV)
     
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_csv_sem_coluna_descricao_lanca_excecao(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo):
-        """Deve lançar ValidationException se falta coluna descricao"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'valor': [100.0]
-        })
-        mock_read_csv.return_value = df
-        mock_tag_repo.buscar_por_nome.return_value = tag_rotina
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        with pytest.raises(ValidationException) as exc_info:
-            use_case.execute(arquivo, nome_arquivo)
-        
-        assert "Coluna 'descricao' não encontrada" in str(exc_info.value)
-    
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_csv_sem_coluna_valor_lanca_excecao(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo):
-        """Deve lançar ValidationException se falta coluna valor"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Compra 1']
-        })
-        mock_read_csv.return_value = df
-        mock_tag_repo.buscar_por_nome.return_value = tag_rotina
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        with pytest.raises(ValidationException) as exc_info:
-            use_case.execute(arquivo, nome_arquivo)
-        
-        assert "Coluna 'valor' não encontrada" in str(exc_info.value)
-    
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
     def test_importa_csv_com_sucesso(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
         """Deve importar CSV com sucesso"""
-        # DataFrame válido
-        df = pd.DataFrame({
-            'data': ['01/01/2024', '02/01/2024'],
-            'descricao': ['Salário', 'Supermercado'],
-            'valor': [5000.0, -150.0]
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_EXTRATO_DUAS_LINHAS.copy(deep=False)
         
         # Mock da tag
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        # Mock das transações criadas
-        transacao1 = Mock(spec=Transacao)
-        transacao1.id = 1
-        transacao2 = Mock(spec=Transacao)
-        transacao2.id = 2
-        
-        mock_transacao_repo.criar.side_effect = [transacao1, transacao2]
-        mock_transacao_repo.buscar_por_id.side_effect = [transacao1, transacao2]
+        _simular_persistencia(mock_transacao_repo)
         
         # Mock de regras
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        resultado = use_case.execute(arquivo, nome_arquivo)
+        resultado = use_case.execute(_ARQUIVO, _EXTRATO_CSV)
         
         # Verificações
         assert resultado.total_importado == 2
@@ -169,224 +182,89 @@ class TestImportarExtratoUseCase:
         assert mock_transacao_repo.criar.call_count == 2
         assert mock_transacao_repo.atualizar.call_count == 4  # 2 para tags + 2 para regras
     
-    @patch('app.application.use_cases.importar_extrato.pd.read_excel')
-    def test_importa_excel_com_sucesso(self, mock_read_excel, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_importa_excel_com_sucesso(self, mock_read_excel, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve importar Excel com sucesso"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Compra'],
-            'valor': [-100.0]
-        })
-        mock_read_excel.return_value = df
+        mock_read_excel.return_value = _DF_COMPRA.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.xlsx"
-        
-        resultado = use_case.execute(arquivo, nome_arquivo)
+        resultado = use_case.execute(_ARQUIVO, _EXTRATO_XLSX)
         
         assert resultado.total_importado == 1
         assert len(resultado.transacoes_ids) == 1
     
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_valor_positivo_cria_entrada(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
-        """Deve criar transação do tipo ENTRADA para valor positivo"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Salário'],
-            'valor': [5000.0]
-        })
-        mock_read_csv.return_value = df
-        
-        mock_tag_repo.buscar_por_nome.return_value = tag_rotina
-        
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        use_case.execute(arquivo, nome_arquivo)
-        
-        # Verifica que foi chamado criar com tipo ENTRADA
-        call_args = mock_transacao_repo.criar.call_args[0][0]
-        assert call_args.tipo == TipoTransacao.ENTRADA
-        assert call_args.valor == 5000.0
-    
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_valor_negativo_cria_saida(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
-        """Deve criar transação do tipo SAIDA para valor negativo"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Supermercado'],
-            'valor': [-150.0]
-        })
-        mock_read_csv.return_value = df
+    @pytest.mark.parametrize("df_entrada, esperado", [
+        (_DF_SALARIO, {"tipo": TipoTransacao.ENTRADA, "valor": 5000.0}),
+        (_DF_SUPERMERCADO, {"tipo": TipoTransacao.SAIDA, "valor": 150.0}),
+        (_DF_COMPRA_COM_CATEGORIA, {"categoria": "Alimentação"}),
+        (_DF_COMPRA, {"origem": "extrato_bancario"}),
+    ], ids=["valor_positivo_cria_entrada", "valor_negativo_cria_saida", "com_categoria_opcional", "origem_e_extrato_bancario"])
+    def test_transacao_criada_a_partir_da_linha(self, df_entrada, esperado, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
+        """Deve criar a transação com tipo, valor absoluto, categoria e origem derivados da linha"""
+        mock_read_csv.return_value = df_entrada.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        use_case.execute(arquivo, nome_arquivo)
+        use_case.execute(_ARQUIVO, _EXTRATO_CSV)
         
-        # Verifica que foi chamado criar com tipo SAIDA e valor absoluto
-        call_args = mock_transacao_repo.criar.call_args[0][0]
-        assert call_args.tipo == TipoTransacao.SAIDA
-        assert call_args.valor == 150.0
+        criada = mock_transacao_repo.criar.call_args[0][0]
+        for atributo, valor in esperado.items():
+            assert getattr(criada, atributo) == valor
     
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_cria_tag_rotina_se_nao_existe(self, mock_read_csv, use_case, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_cria_tag_rotina_se_nao_existe(self, mock_read_csv, use_case, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve criar tag Rotina se não existir"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Compra'],
-            'valor': [-100.0]
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_COMPRA.copy(deep=False)
         
         # Tag não existe
         tag_criada = Tag(nome="Rotina", cor="#4B5563")
         tag_criada.id = 1
         
+        criar_tag = mock_tag_repo.criar
         mock_tag_repo.buscar_por_nome.return_value = None
-        mock_tag_repo.criar.return_value = tag_criada
-        
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
+        criar_tag.return_value = tag_criada
         
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        use_case.execute(arquivo, nome_arquivo)
+        use_case.execute(_ARQUIVO, _EXTRATO_CSV)
         
         # Verifica que tag foi criada
-        mock_tag_repo.criar.assert_called_once()
-        assert mock_tag_repo.criar.call_args[0][0].nome == "Rotina"
+        criar_tag.assert_called_once()
+        assert criar_tag.call_args[0][0].nome == "Rotina"
     
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_aplica_regras_apos_importacao(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_aplica_regras_apos_importacao(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve aplicar regras ativas após importação"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Supermercado'],
-            'valor': [-100.0]
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_SUPERMERCADO.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
         
         # Criar regra mock
-        regra = Mock(spec=Regra)
+        regra = Mock(spec_set=Regra)
         regra.ativo = True
         mock_regra_repo.listar.return_value = [regra]
         
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        use_case.execute(arquivo, nome_arquivo)
+        use_case.execute(_ARQUIVO, _EXTRATO_CSV)
         
         # Verifica que regra foi aplicada
-        regra.aplicar_em.assert_called_once_with(transacao)
-    
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_com_categoria_opcional(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
-        """Deve importar categoria opcional se presente"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Compra'],
-            'valor': [-100.0],
-            'categoria': ['Alimentação']
-        })
-        mock_read_csv.return_value = df
-        
-        mock_tag_repo.buscar_por_nome.return_value = tag_rotina
-        
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        use_case.execute(arquivo, nome_arquivo)
-        
-        # Verifica categoria
-        call_args = mock_transacao_repo.criar.call_args[0][0]
-        assert call_args.categoria == 'Alimentação'
-    
-    @patch('app.application.use_cases.importar_extrato.pd.read_csv')
-    def test_origem_e_extrato_bancario(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
-        """Deve definir origem como extrato_bancario"""
-        df = pd.DataFrame({
-            'data': ['01/01/2024'],
-            'descricao': ['Compra'],
-            'valor': [-100.0]
-        })
-        mock_read_csv.return_value = df
-        
-        mock_tag_repo.buscar_por_nome.return_value = tag_rotina
-        
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "extrato.csv"
-        
-        use_case.execute(arquivo, nome_arquivo)
-        
-        # Verifica origem
-        call_args = mock_transacao_repo.criar.call_args[0][0]
-        assert call_args.origem == 'extrato_bancario'
+        regra.aplicar_em.assert_called_once_with(transacao_mock)
 
 
+@pytest.mark.xdist_group(name="importacao")
 class TestImportarFaturaUseCase:
     """Testes para ImportarFaturaUseCase"""
     
-    @pytest.fixture
-    def mock_transacao_repo(self):
-        """Mock do repositório de transações"""
-        return Mock()
-    
-    @pytest.fixture
-    def mock_tag_repo(self):
-        """Mock do repositório de tags"""
-        return Mock()
-    
-    @pytest.fixture
-    def mock_regra_repo(self):
-        """Mock do repositório de regras"""
-        return Mock()
-    
     @pytest.fixture
     def use_case(self, mock_transacao_repo, mock_tag_repo, mock_regra_repo):
         """Instância do use case com mocks"""
@@ -397,182 +275,108 @@ class TestImportarFaturaUseCase:
         )
     
     @pytest.fixture
-    def tag_rotina(self):
-        """Tag Rotina padrão"""
-        tag = Tag(nome="Rotina", cor="#4B5563")
-        tag.id = 1
-        return tag
+    def mock_read_csv(self):
+        """pd.read_csv patcheado durante o teste"""
+        with patch('app.application.use_cases.importar_fatura.pd.read_csv') as mock:
+            yield mock
     
     def test_arquivo_formato_invalido_lanca_excecao(self, use_case):
         """Deve lançar ValidationException para formato não suportado"""
-        arquivo = b"conteudo"
-        nome_arquivo = "arquivo.pdf"
-        
-        with pytest.raises(ValidationException) as exc_info:
-            use_case.execute(arquivo, nome_arquivo)
-        
-        assert "Formato de arquivo não suportado" in str(exc_info.value)
+        _assert_formato_nao_suportado(use_case, "arquivo.pdf")
     
-    @patch('app.application.use_cases.importar_fatura.pd.read_csv')
     def test_importa_csv_fatura_com_sucesso(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
         """Deve importar CSV de fatura com sucesso"""
-        df = pd.DataFrame({
-            'data': ['15/12/2024', '20/12/2024'],
-            'descricao': ['Restaurante', 'Gasolina'],
-            'valor': [85.50, 200.00]
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_FATURA_DUAS_LINHAS.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao1 = Mock(spec=Transacao)
-        transacao1.id = 1
-        transacao2 = Mock(spec=Transacao)
-        transacao2.id = 2
-        
-        mock_transacao_repo.criar.side_effect = [transacao1, transacao2]
-        mock_transacao_repo.buscar_por_id.side_effect = [transacao1, transacao2]
-        mock_regra_repo.listar.return_value = []
+        _simular_persistencia(mock_transacao_repo)
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        arquivo = b"conteudo"
-        nome_arquivo = "fatura.csv"
-        
-        resultado = use_case.execute(arquivo, nome_arquivo)
+        resultado = use_case.execute(_ARQUIVO, _FATURA_CSV)
         
         assert resultado.total_importado == 2
         assert len(resultado.transacoes_ids) == 2
     
-    @patch('app.application.use_cases.importar_fatura.pd.read_csv')
-    def test_todas_transacoes_sao_saida(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_todas_transacoes_sao_saida(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve criar todas transações como SAIDA"""
-        df = pd.DataFrame({
-            'data': ['15/12/2024'],
-            'descricao': ['Compra'],
-            'valor': [100.0]
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_FATURA_COMPRA.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "fatura.csv"
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        use_case.execute(arquivo, nome_arquivo)
+        use_case.execute(_ARQUIVO, _FATURA_CSV)
         
         # Verifica tipo SAIDA
         call_args = mock_transacao_repo.criar.call_args[0][0]
         assert call_args.tipo == TipoTransacao.SAIDA
     
-    @patch('app.application.use_cases.importar_fatura.pd.read_csv')
-    def test_valores_sempre_positivos(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_valores_sempre_positivos(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve converter valores negativos para positivos"""
-        df = pd.DataFrame({
-            'data': ['15/12/2024'],
-            'descricao': ['Compra'],
-            'valor': [-100.0]  # Valor negativo
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_FATURA_COMPRA_NEGATIVA.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        arquivo = b"conteudo"
-        nome_arquivo = "fatura.csv"
-        
-        use_case.execute(arquivo, nome_arquivo)
+        use_case.execute(_ARQUIVO, _FATURA_CSV)
         
         # Verifica valor positivo
         call_args = mock_transacao_repo.criar.call_args[0][0]
         assert call_args.valor == 100.0
     
-    @patch('app.application.use_cases.importar_fatura.pd.read_csv')
-    def test_origem_e_fatura_cartao(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_origem_e_fatura_cartao(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve definir origem como fatura_cartao"""
-        df = pd.DataFrame({
-            'data': ['15/12/2024'],
-            'descricao': ['Compra'],
-            'valor': [100.0]
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_FATURA_COMPRA.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "fatura.csv"
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        use_case.execute(arquivo, nome_arquivo)
+        use_case.execute(_ARQUIVO, _FATURA_CSV)
         
         # Verifica origem
         call_args = mock_transacao_repo.criar.call_args[0][0]
         assert call_args.origem == 'fatura_cartao'
     
-    @patch('app.application.use_cases.importar_fatura.pd.read_csv')
-    def test_data_fatura_opcional(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_data_fatura_opcional(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve processar data_fatura se presente"""
-        df = pd.DataFrame({
-            'data': ['15/12/2024'],
-            'descricao': ['Compra'],
-            'valor': [100.0],
-            'data_fatura': ['05/01/2025']
-        })
-        mock_read_csv.return_value = df
+        mock_read_csv.return_value = _DF_FATURA_COM_DATA_FATURA.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
-        
-        arquivo = b"conteudo"
-        nome_arquivo = "fatura.csv"
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        use_case.execute(arquivo, nome_arquivo)
+        use_case.execute(_ARQUIVO, _FATURA_CSV)
         
         # Verifica data_fatura
         call_args = mock_transacao_repo.criar.call_args[0][0]
         assert call_args.data_fatura == date(2025, 1, 5)
     
-    @patch('app.application.use_cases.importar_fatura.pd.read_csv')
-    def test_normaliza_colunas(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo):
+    def test_normaliza_colunas(self, mock_read_csv, use_case, tag_rotina, mock_tag_repo, mock_transacao_repo, mock_regra_repo, transacao_mock):
         """Deve normalizar nomes de colunas (lowercase, strip)"""
-        # DataFrame com colunas maiúsculas e espaços
-        df_original = pd.DataFrame({
-            'Data  ': ['15/12/2024'],
-            'DESCRICAO': ['Compra'],
-            ' Valor': [100.0]
-        })
-        mock_read_csv.return_value = df_original
+        mock_read_csv.return_value = _DF_FATURA_COLUNAS_DESNORMALIZADAS.copy(deep=False)
         
         mock_tag_repo.buscar_por_nome.return_value = tag_rotina
         
-        transacao = Mock(spec=Transacao)
-        transacao.id = 1
-        mock_transacao_repo.criar.return_value = transacao
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_regra_repo.listar.return_value = []
+        mock_transacao_repo.criar.return_value = transacao_mock
+        mock_transacao_repo.buscar_por_id.return_value = transacao_mock
+        mock_regra_repo.listar.return_value = _SEM_REGRAS
         
-        arquivo = b"conteudo"
-        nome_arquivo = "fatura.csv"
-        
-        # Não deve lançar exceção
-        resultado = use_case.execute(arquivo, nome_arquivo)
+        resultado = use_case.execute(_ARQUIVO, _FATURA_CSV)
         assert resultado.total_importado == 1
+        
+        # Colunas desnormalizadas foram lidas pelos nomes canônicos
+        criada = mock_transacao_repo.criar.call_args[0][0]
+        assert criada.data == date(2024, 12, 15)
+        assert criada.descricao == 'Compra'
+        assert criada.valor == 100.0
@@ -2,8 +2,7 @@
 Testes para Use Cases de Tags em Transações
 """
 import pytest
-from unittest.mock import Mock
-from datetime import datetime
+from datetime import date
 
 from app.application.use_cases.adicionar_tag_transacao import AdicionarTagTransacaoUseCase
 from app.application.use_cases.remover_tag_transacao import RemoverTagTransacaoUseCase
@@ -14,17 +13,24 @@ from app.domain.entities.tag import Tag
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 
 
+_DATA = date(2024, 1, 1)
+
+
+def _criar_transacao(tag_ids=()):
+    """Transação padrão (id=1) usada pelos testes; cada chamada devolve uma instância nova"""
+    return Transacao(
+        id=1,
+        data=_DATA,
+        descricao="Compra",
+        valor=100.0,
+        tipo=TipoTransacao.SAIDA,
+        tag_ids=list(tag_ids)
+    )
+
+
 class TestAdicionarTagTransacaoUseCase:
     """Testes para AdicionarTagTransacaoUseCase"""
     
-    @pytest.fixture
-    def mock_transacao_repo(self):
-        return Mock()
-    
-    @pytest.fixture
-    def mock_tag_repo(self):
-        return Mock()
-    
     @pytest.fixture
     def use_case(self, mock_transacao_repo, mock_tag_repo):
         return AdicionarTagTransacaoUseCase(mock_transacao_repo, mock_tag_repo)
@@ -32,13 +38,7 @@ class TestAdicionarTagTransacaoUseCase:
     def test_adicionar_tag_com_sucesso(self, use_case, mock_transacao_repo, mock_tag_repo):
         """Deve adicionar tag à transação com sucesso"""
         # Arrange
-        transacao = Transacao(
-            data=datetime(2024, 1, 1).date(),
-            descricao="Compra",
-            valor=100.0,
-            tipo=TipoTransacao.SAIDA
-        )
-        transacao.id = 1
+        transacao = _criar_transacao()
         
         tag = Tag(nome="Importante", cor="#FF0000")
         tag.id = 1
@@ -54,50 +54,40 @@ class TestAdicionarTagTransacaoUseCase:
         mock_tag_repo.buscar_por_id.assert_called_once_with(1)
         mock_transacao_repo.adicionar_tag.assert_called_once_with(1, 1)
     
-    def test_transacao_inexistente_lanca_excecao(self, use_case, mock_transacao_repo, mock_tag_repo):
-        """Deve lançar exceção se transação não existir"""
+    def test_tag_inexistente_lanca_excecao(self, use_case, mock_transacao_repo, mock_tag_repo):
+        """Deve lançar exceção se tag não existir"""
         # Arrange
-        mock_transacao_repo.buscar_por_id.return_value = None
+        transacao = _criar_transacao()
+        
+        mock_transacao_repo.buscar_por_id.return_value = transacao
+        mock_tag_repo.buscar_por_id.return_value = None
         
         # Act & Assert
         with pytest.raises(EntityNotFoundException) as exc_info:
-            use_case.execute(transacao_id=999, tag_id=1)
+            use_case.execute(transacao_id=1, tag_id=999)
         
-        assert "Transacao" in str(exc_info.value)
-        assert "999" in str(exc_info.value)
-        mock_tag_repo.buscar_por_id.assert_not_called()
+        assert exc_info.value.entity_name == "Tag"
+        assert exc_info.value.entity_id == 999
         mock_transacao_repo.adicionar_tag.assert_not_called()
     
-    def test_tag_inexistente_lanca_excecao(self, use_case, mock_transacao_repo, mock_tag_repo):
-        """Deve lançar exceção se tag não existir"""
+    def test_transacao_inexistente_lanca_excecao(self, use_case, mock_transacao_repo, mock_tag_repo):
+        """Deve lançar exceção se transação não existir, sem consultar a tag"""
         # Arrange
-        transacao = Transacao(
-            data=datetime(2024, 1, 1).date(),
-            descricao="Compra",
-            valor=100.0,
-            tipo=TipoTransacao.SAIDA
-        )
-        transacao.id = 1
-        
-        mock_transacao_repo.buscar_por_id.return_value = transacao
-        mock_tag_repo.buscar_por_id.return_value = None
+        mock_transacao_repo.buscar_por_id.return_value = None
         
         # Act & Assert
         with pytest.raises(EntityNotFoundException) as exc_info:
-            use_case.execute(transacao_id=1, tag_id=999)
+            use_case.execute(transacao_id=999, tag_id=1)
         
-        assert "Tag" in str(exc_info.value)
-        assert "999" in str(exc_info.value)
+        assert exc_info.value.entity_name == "Transacao"
+        assert exc_info.value.entity_id == 999
+        mock_tag_repo.buscar_por_id.assert_not_called()
         mock_transacao_repo.adicionar_tag.assert_not_called()
 
 
 class TestRemoverTagTransacaoUseCase:
     """Testes para RemoverTagTransacaoUseCase"""
     
-    @pytest.fixture
-    def mock_transacao_repo(self):
-        return Mock()
-    
     @pytest.fixture
     def use_case(self, mock_transacao_repo):
         return RemoverTagTransacaoUseCase(mock_transacao_repo)
@@ -105,14 +95,7 @@ class TestRemoverTagTransacaoUseCase:
     def test_remover_tag_com_sucesso(self, use_case, mock_transacao_repo):
         """Deve remover tag da transação com sucesso"""
         # Arrange
-        transacao = Transacao(
-            data=datetime(2024, 1, 1).date(),
-            descricao="Compra",
-            valor=100.0,
-            tipo=TipoTransacao.SAIDA
-        )
-        transacao.id = 1
-        transacao.tag_ids = [1, 2, 3]
+        transacao = _criar_transacao(tag_ids=[1, 2, 3])
         
         mock_transacao_repo.buscar_por_id.return_value = transacao
         
@@ -132,22 +115,14 @@ class TestRemoverTagTransacaoUseCase:
         with pytest.raises(EntityNotFoundException) as exc_info:
             use_case.execute(transacao_id=999, tag_id=1)
         
-        assert "Transacao" in str(exc_info.value)
-        assert "999" in str(exc_info.value)
+        assert exc_info.value.entity_name == "Transacao"
+        assert exc_info.value.entity_id == 999
         mock_transacao_repo.remover_tag.assert_not_called()
 
 
 class TestListarTagsTransacaoUseCase:
     """Testes para ListarTagsTransacaoUseCase"""
     
-    @pytest.fixture
-    def mock_transacao_repo(self):
-        return Mock()
-    
-    @pytest.fixture
-    def mock_tag_repo(self):
-        return Mock()
-    
     @pytest.fixture
     def use_case(self, mock_transacao_repo, mock_tag_repo):
         return ListarTagsTransacaoUseCase(mock_transacao_repo, mock_tag_repo)
@@ -155,14 +130,7 @@ class TestListarTagsTransacaoUseCase:
     def test_listar_tags_com_sucesso(self, use_case, mock_transacao_repo, mock_tag_repo):
         """Deve listar tags da transação com sucesso"""
         # Arrange
-        transacao = Transacao(
-            data=datetime(2024, 1, 1).date(),
-            descricao="Compra",
-            valor=100.0,
-            tipo=TipoTransacao.SAIDA
-        )
-        transacao.id = 1
-        transacao.tag_ids = [1, 2]
+        transacao = _criar_transacao(tag_ids=[1, 2])
         
         tag1 = Tag(nome="Importante", cor="#FF0000")
         tag1.id = 1
@@ -187,14 +155,7 @@ class TestListarTagsTransacaoUseCase:
     def test_transacao_sem_tags_retorna_lista_vazia(self, use_case, mock_transacao_repo, mock_tag_repo):
         """Deve retornar lista vazia se transação não tem tags"""
         # Arrange
-        transacao = Transacao(
-            data=datetime(2024, 1, 1).date(),
-            descricao="Compra",
-            valor=100.0,
-            tipo=TipoTransacao.SAIDA
-        )
-        transacao.id = 1
-        transacao.tag_ids = []
+        transacao = _criar_transacao()
         
         mock_transacao_repo.buscar_por_id.return_value = transacao
         mock_tag_repo.listar_por_ids.return_value = []
@@ -207,7 +168,7 @@ class TestListarTagsTransacaoUseCase:
         mock_tag_repo.listar_por_ids.assert_called_once_with([])
     
     def test_transacao_inexistente_lanca_excecao(self, use_case, mock_transacao_repo, mock_tag_repo):
-        """Deve lançar exceção se transação não existir"""
+        """Deve lançar exceção se transação não existir, sem buscar tags"""
         # Arrange
         mock_transacao_repo.buscar_por_id.return_value = None
         
@@ -215,6 +176,6 @@ class TestListarTagsTransacaoUseCase:
         with pytest.raises(EntityNotFoundException) as exc_info:
             use_case.execute(transacao_id=999)
         
-        assert "Transacao" in str(exc_info.value)
-        assert "999" in str(exc_info.value)
+        assert exc_info.value.entity_name == "Transacao"
+        assert exc_info.value.entity_id == 999
         mock_tag_repo.listar_por_ids.assert_not_called()
@@ -4,7 +4,6 @@ Testes unitários para Use Cases de Tags
 Objetivo: Testar lógica de aplicação de tags usando mocks
 """
 import pytest
-from unittest.mock import Mock
 from app.application.use_cases.criar_tag import CriarTagUseCase
 from app.application.use_cases.listar_tags import ListarTagsUseCase
 from app.application.use_cases.atualizar_tag import AtualizarTagUseCase
@@ -13,107 +12,98 @@ from app.application.dto.tag_dto import CriarTagDTO, AtualizarTagDTO
 from app.domain.entities.tag import Tag
 from app.application.exceptions.application_exceptions import (
     EntityNotFoundException,
-    DuplicateEntityException,
     ValidationException
 )
 
 
+# Os use cases só leem o DTO, então a mesma instância serve a todos os testes
+_DTO_IMPORTANTE = CriarTagDTO(nome="Importante")
+
+
 @pytest.mark.unit
 class TestCriarTagUseCase:
     """Testes para CriarTagUseCase"""
     
-    def test_criar_tag_com_sucesso(self):
+    @pytest.fixture
+    def use_case(self, mock_tag_repo):
+        """Use case construído sobre os mocks de repositório"""
+        return CriarTagUseCase(mock_tag_repo)
+    
+    def test_criar_tag_com_sucesso(self, use_case, mock_tag_repo):
         """
         ARRANGE: Mock do repositório e DTO válido
         ACT: Executar use case
         ASSERT: Verificar que tag foi criada
         """
         # Arrange
-        mock_repository = Mock()
-        mock_repository.buscar_por_nome.return_value = None  # Tag não existe
+        mock_tag_repo.buscar_por_nome.return_value = None  # Tag não existe
         tag_criada = Tag(id=1, nome="Importante")
-        mock_repository.criar.return_value = tag_criada
-        
-        use_case = CriarTagUseCase(mock_repository)
-        dto = CriarTagDTO(nome="Importante")
+        mock_tag_repo.criar.return_value = tag_criada
         
         # Act
-        resultado = use_case.execute(dto)
+        resultado = use_case.execute(_DTO_IMPORTANTE)
         
         # Assert
-        mock_repository.buscar_por_nome.assert_called_once_with("Importante")
-        mock_repository.criar.assert_called_once()
+        mock_tag_repo.buscar_por_nome.assert_called_once_with("Importante")
+        mock_tag_repo.criar.assert_called_once()
         assert resultado.nome == "Importante"
     
-    def test_criar_tag_duplicada_lanca_excecao(self):
+    def test_criar_tag_duplicada_lanca_excecao(self, use_case, mock_tag_repo):
         """Testa que criar tag com nome duplicado lança exceção"""
         # Arrange
-        mock_repository = Mock()
         tag_existente = Tag(id=1, nome="Importante")
-        mock_repository.buscar_por_nome.return_value = tag_existente
-        
-        use_case = CriarTagUseCase(mock_repository)
-        dto = CriarTagDTO(nome="Importante")
+        mock_tag_repo.buscar_por_nome.return_value = tag_existente
         
         # Act & Assert
-        with pytest.raises(ValidationException) as exc_info:
-            use_case.execute(dto)
+        with pytest.raises(ValidationException, match="Importante"):
+            use_case.execute(_DTO_IMPORTANTE)
         
-        assert "Importante" in str(exc_info.value)
-        mock_repository.criar.assert_not_called()
+        mock_tag_repo.criar.assert_not_called()
 
 
 @pytest.mark.unit
 class TestListarTagsUseCase:
     """Testes para ListarTagsUseCase"""
     
-    def test_listar_tags_retorna_todas_tags(self):
+    @pytest.fixture
+    def use_case(self, mock_tag_repo):
+        """Use case construído sobre os mocks de repositório"""
+        return ListarTagsUseCase(mock_tag_repo)
+    
+    @pytest.mark.parametrize(
+        "nomes",
+        [[], ["Importante"], ["Importante", "Recorrente", "Urgente"]],
+        ids=["vazio", "uma_tag", "varias_tags"],
+    )
+    def test_listar_tags_retorna_todas_tags(self, use_case, mock_tag_repo, nomes):
         """
-        ARRANGE: Mock do repositório com lista de tags
+        ARRANGE: Mock do repositório com N tags (inclusive nenhuma)
         ACT: Executar use case
-        ASSERT: Verificar que todas as tags foram retornadas
+        ASSERT: Verificar que todas as tags foram retornadas, na mesma ordem
         """
         # Arrange
-        mock_repository = Mock()
-        tags = [
-            Tag(id=1, nome="Importante"),
-            Tag(id=2, nome="Recorrente"),
-            Tag(id=3, nome="Urgente")
+        mock_tag_repo.listar.return_value = [
+            Tag(id=i, nome=nome) for i, nome in enumerate(nomes, start=1)
         ]
-        mock_repository.listar.return_value = tags
-        
-        use_case = ListarTagsUseCase(mock_repository)
-        
-        # Act
-        resultado = use_case.execute()
-        
-        # Assert
-        mock_repository.listar.assert_called_once()
-        assert len(resultado) == 3
-        assert resultado[0].nome == "Importante"
-        assert resultado[1].nome == "Recorrente"
-        assert resultado[2].nome == "Urgente"
-    
-    def test_listar_tags_vazio_retorna_lista_vazia(self):
-        """Testa que listar tags vazio retorna lista vazia"""
-        # Arrange
-        mock_repository = Mock()
-        mock_repository.listar.return_value = []
-        
-        use_case = ListarTagsUseCase(mock_repository)
         
         # Act
         resultado = use_case.execute()
         
         # Assert
-        assert len(resultado) == 0
+        mock_tag_repo.listar.assert_called_once()
+        assert [tag.nome for tag in resultado] == nomes
 
 
 @pytest.mark.unit
 class TestAtualizarTagUseCase:
     """Testes para AtualizarTagUseCase"""
     
-    def test_atualizar_tag_existente_com_sucesso(self):
+    @pytest.fixture
+    def use_case(self, mock_tag_repo):
+        """Use case construído sobre os mocks de repositório"""
+        return AtualizarTagUseCase(mock_tag_repo)
+    
+    def test_atualizar_tag_existente_com_sucesso(self, use_case, mock_tag_repo):
         """
         ARRANGE: Mock do repositório com tag existente
         ACT: Executar use case
@@ -123,58 +113,59 @@ class TestAtualizarTagUseCase:
         tag_existente = Tag(id=1, nome="Antigo")
         tag_atualizada = Tag(id=1, nome="Novo")
         
-        mock_repository = Mock()
-        mock_repository.buscar_por_id.return_value = tag_existente
-        mock_repository.buscar_por_nome.return_value = None  # Nome não duplicado
-        mock_repository.atualizar.return_value = tag_atualizada
+        mock_tag_repo.buscar_por_id.return_value = tag_existente
+        mock_tag_repo.buscar_por_nome.return_value = None  # Nome não duplicado
+        mock_tag_repo.atualizar.return_value = tag_atualizada
         
-        use_case = AtualizarTagUseCase(mock_repository)
         dto = AtualizarTagDTO(nome="Novo")
         
         # Act
         resultado = use_case.execute(1, dto)
         
         # Assert
-        mock_repository.buscar_por_id.assert_called_once_with(1)
-        mock_repository.atualizar.assert_called_once()
+        mock_tag_repo.buscar_por_id.assert_called_once_with(1)
+        mock_tag_repo.atualizar.assert_called_once()
         assert resultado.nome == "Novo"
     
-    def test_atualizar_tag_inexistente_lanca_excecao(self):
-        """Testa que atualizar tag inexistente lança exceção"""
-        # Arrange
-        mock_repository = Mock()
-        mock_repository.buscar_por_id.return_value = None
-        
-        use_case = AtualizarTagUseCase(mock_repository)
-        dto = AtualizarTagDTO(nome="Novo")
-        
-        # Act & Assert
-        with pytest.raises(EntityNotFoundException):
-            use_case.execute(999, dto)
-    
-    def test_atualizar_tag_para_nome_duplicado_lanca_excecao(self):
+    def test_atualizar_tag_para_nome_duplicado_lanca_excecao(self, use_case, mock_tag_repo):
         """Testa que atualizar para nome já existente lança exceção"""
         # Arrange
         tag_existente = Tag(id=1, nome="Antigo")
         tag_com_nome_duplicado = Tag(id=2, nome="Duplicado")
         
-        mock_repository = Mock()
-        mock_repository.buscar_por_id.return_value = tag_existente
-        mock_repository.buscar_por_nome.return_value = tag_com_nome_duplicado
+        mock_tag_repo.buscar_por_id.return_value = tag_existente
+        mock_tag_repo.buscar_por_nome.return_value = tag_com_nome_duplicado
         
-        use_case = AtualizarTagUseCase(mock_repository)
         dto = AtualizarTagDTO(nome="Duplicado")
         
         # Act & Assert
         with pytest.raises(ValidationException):
             use_case.execute(1, dto)
+    
+    def test_atualizar_tag_inexistente_lanca_excecao(self, use_case, mock_tag_repo):
+        """Deve lançar exceção se a tag não existir, sem gravar no repositório"""
+        # Arrange
+        mock_tag_repo.buscar_por_id.return_value = None
+        
+        # Act & Assert
+        with pytest.raises(EntityNotFoundException) as exc_info:
+            use_case.execute(999, AtualizarTagDTO(nome="Novo"))
+        
+        assert exc_info.value.entity_name == "Tag"
+        assert exc_info.value.entity_id == 999
+        mock_tag_repo.atualizar.assert_not_called()
 
 
 @pytest.mark.unit
 class TestDeletarTagUseCase:
     """Testes para DeletarTagUseCase"""
     
-    def test_deletar_tag_existente_com_sucesso(self):
+    @pytest.fixture
+    def use_case(self, mock_tag_repo):
+        """Use case construído sobre os mocks de repositório"""
+        return DeletarTagUseCase(mock_tag_repo)
+    
+    def test_deletar_tag_existente_com_sucesso(self, use_case, mock_tag_repo):
         """
         ARRANGE: Mock do repositório com tag existente
         ACT: Executar use case
@@ -183,28 +174,24 @@ class TestDeletarTagUseCase:
         # Arrange
         tag_existente = Tag(id=1, nome="A Deletar")
         
-        mock_repository = Mock()
-        mock_repository.buscar_por_id.return_value = tag_existente
-        
-        use_case = DeletarTagUseCase(mock_repository)
+        mock_tag_repo.buscar_por_id.return_value = tag_existente
         
         # Act
         use_case.execute(1)
         
         # Assert
-        mock_repository.buscar_por_id.assert_called_once_with(1)
-        mock_repository.deletar.assert_called_once_with(1)
+        mock_tag_repo.buscar_por_id.assert_called_once_with(1)
+        mock_tag_repo.deletar.assert_called_once_with(1)
     
-    def test_deletar_tag_inexistente_lanca_excecao(self):
-        """Testa que deletar tag inexistente lança exceção"""
+    def test_deletar_tag_inexistente_lanca_excecao(self, use_case, mock_tag_repo):
+        """Deve lançar exceção se a tag não existir, sem deletar nada"""
         # Arrange
-        mock_repository = Mock()
-        mock_repository.buscar_por_id.return_value = None
-        
-        use_case = DeletarTagUseCase(mock_repository)
+        mock_tag_repo.buscar_por_id.return_value = None
         
         # Act & Assert
-        with pytest.raises(EntityNotFoundException):
+        with pytest.raises(EntityNotFoundException) as exc_info:
             use_case.execute(999)
         
-        mock_repository.deletar.assert_not_called()
+        assert exc_info.value.entity_name == "Tag"
+        assert exc_info.value.entity_id == 999
+        mock_tag_repo.deletar.assert_not_called()
@@ -5,11 +5,31 @@ Objetivo: Testar a lógica de negócio das entidades sem dependências externas
 Padrão: Arrange-Act-Assert
 """
 import pytest
+from dataclasses import replace
 from datetime import date
 from app.domain.entities.transacao import Transacao
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 
 
+_DATA = date(2026, 1, 15)
+
+# Transação de saída usada pelos testes de comportamento; os testes de criação
+# continuam chamando o construtor diretamente
+_TRANSACAO_BASE = Transacao(
+    data=_DATA,
+    descricao="Compra",
+    valor=100.00,
+    tipo=TipoTransacao.SAIDA,
+    origem="manual"
+)
+
+
+@pytest.fixture
+def transacao_base():
+    """Cópia nova de _TRANSACAO_BASE (tag_ids próprio: a cópia rasa compartilharia a lista)"""
+    return replace(_TRANSACAO_BASE, tag_ids=[])
+
+
 @pytest.mark.unit
 class TestTransacao:
     """Testes para a entidade Transacao"""
@@ -21,7 +41,7 @@ class TestTransacao:
         ASSERT: Verificar que foi criada corretamente
         """
         # Arrange
-        data = date(2026, 1, 15)
+        data = _DATA
         descricao = "Compra no supermercado"
         valor = 150.50
         tipo = TipoTransacao.SAIDA
@@ -48,7 +68,7 @@ class TestTransacao:
         """Testa criação de transação com categoria"""
         # Arrange & Act
         transacao = Transacao(
-            data=date(2026, 1, 15),
+            data=_DATA,
             descricao="Almoço",
             valor=45.00,
             tipo=TipoTransacao.SAIDA,
@@ -59,16 +79,10 @@ class TestTransacao:
         # Assert
         assert transacao.categoria == "Alimentação"
     
-    def test_atualizar_categoria(self):
+    def test_atualizar_categoria(self, transacao_base):
         """Testa atualização de categoria da transação"""
         # Arrange
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=100.00,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual"
-        )
+        transacao = transacao_base
         
         # Act
         transacao.alterar_categoria("Vestuário")
@@ -76,17 +90,11 @@ class TestTransacao:
         # Assert
         assert transacao.categoria == "Vestuário"
     
-    def test_atualizar_categoria_vazia(self):
+    def test_atualizar_categoria_vazia(self, transacao_base):
         """Testa atualização de categoria para string vazia"""
         # Arrange
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=100.00,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual",
-            categoria="Vestuário"
-        )
+        transacao = transacao_base
+        transacao.alterar_categoria("Vestuário")
         
         # Act
         transacao.alterar_categoria("")
@@ -94,128 +102,54 @@ class TestTransacao:
         # Assert
         assert transacao.categoria == ""
     
-    def test_atualizar_valor_preserva_original(self):
-        """Testa que ao atualizar valor, o original é preservado"""
-        # Arrange
-        valor_original = 100.00
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=valor_original,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual"
-        )
-        
-        # Act
-        novo_valor = 120.00
-        transacao.alterar_valor(novo_valor)
-        
-        # Assert
-        assert transacao.valor == novo_valor
-        assert transacao.valor_original == valor_original
-    
-    def test_atualizar_valor_multiplas_vezes_preserva_primeiro_original(self):
-        """Testa que múltiplas atualizações preservam o primeiro valor original"""
+    @pytest.mark.parametrize(
+        "novos_valores",
+        [(120.00,), (120.00, 150.00), (50.00, 75.00, 90.00)],
+        ids=["uma_vez", "multiplas_vezes", "abaixo_do_original"],
+    )
+    def test_atualizar_valor_preserva_primeiro_original(self, transacao_base, novos_valores):
+        """Testa que atualizações de valor preservam o primeiro valor original"""
         # Arrange
-        valor_inicial = 100.00
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=valor_inicial,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual"
-        )
+        transacao = transacao_base
         
         # Act
-        transacao.alterar_valor(120.00)
-        transacao.alterar_valor(150.00)
+        for novo_valor in novos_valores:
+            transacao.alterar_valor(novo_valor)
         
         # Assert
-        assert transacao.valor == 150.00
-        assert transacao.valor_original == valor_inicial
+        assert transacao.valor == novos_valores[-1]
+        assert transacao.valor_original == _TRANSACAO_BASE.valor
     
-    def test_adicionar_tag(self):
-        """Testa adição de tag à transação"""
+    @pytest.mark.parametrize(
+        "operacoes,tag_ids_esperados",
+        [
+            ((("adicionar", 1), ("adicionar", 2)), [1, 2]),
+            ((("adicionar", 1), ("adicionar", 1)), [1]),
+            ((("adicionar", 1), ("adicionar", 2), ("remover", 1)), [2]),
+        ],
+        ids=["adicionar", "adicionar_duplicada_nao_adiciona", "remover"],
+    )
+    def test_operacoes_de_tag(self, transacao_base, operacoes, tag_ids_esperados):
+        """Testa adição, adição duplicada e remoção de tags da transação"""
         # Arrange
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=100.00,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual"
-        )
+        transacao = transacao_base
         
         # Act
-        transacao.adicionar_tag(1)
-        transacao.adicionar_tag(2)
+        for operacao, tag_id in operacoes:
+            getattr(transacao, f"{operacao}_tag")(tag_id)
         
         # Assert
-        assert 1 in transacao.tag_ids
-        assert 2 in transacao.tag_ids
-        assert len(transacao.tag_ids) == 2
+        assert transacao.tag_ids == tag_ids_esperados
     
-    def test_adicionar_tag_duplicada_nao_adiciona(self):
-        """Testa que adicionar tag duplicada não cria duplicata"""
-        # Arrange
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=100.00,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual"
-        )
-        
-        # Act
-        transacao.adicionar_tag(1)
-        transacao.adicionar_tag(1)  # Duplicada
-        
-        # Assert
-        assert len(transacao.tag_ids) == 1
-    
-    def test_remover_tag(self):
-        """Testa remoção de tag"""
-        # Arrange
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=100.00,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual"
-        )
-        transacao.adicionar_tag(1)
-        transacao.adicionar_tag(2)
-        
-        # Act
-        transacao.remover_tag(1)
-        
-        # Assert
-        assert 1 not in transacao.tag_ids
-        assert 2 in transacao.tag_ids
-    
-    def test_eh_entrada_retorna_true_para_tipo_entrada(self):
-        """Testa método eh_entrada para transação de entrada"""
+    @pytest.mark.parametrize(
+        "tipo,esperado",
+        [(TipoTransacao.ENTRADA, True), (TipoTransacao.SAIDA, False)],
+        ids=["entrada", "saida"],
+    )
+    def test_eh_entrada(self, tipo, esperado):
+        """Testa método eh_entrada para cada tipo de transação"""
         # Arrange & Act
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Salário",
-            valor=5000.00,
-            tipo=TipoTransacao.ENTRADA,
-            origem="manual"
-        )
-        
-        # Assert
-        assert transacao.eh_entrada() is True
-    
-    def test_eh_entrada_retorna_false_para_tipo_saida(self):
-        """Testa método eh_entrada para transação de saída"""
-        # Arrange & Act
-        transacao = Transacao(
-            data=date(2026, 1, 15),
-            descricao="Compra",
-            valor=100.00,
-            tipo=TipoTransacao.SAIDA,
-            origem="manual"
-        )
+        transacao = replace(_TRANSACAO_BASE, tipo=tipo, tag_ids=[])
         
         # Assert
-        assert transacao.eh_entrada() is False
+        assert transacao.eh_entrada() is esperado
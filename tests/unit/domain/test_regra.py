@@ -120,6 +120,31 @@ class TestRegraCorrespondeCriterio:
         # Assert
         assert resultado is False
     
+    def test_alterar_criterio_reflete_no_matching(self):
+        """Testa que o matching usa o critério atual, mesmo após já ter sido avaliado"""
+        # Arrange
+        regra = Regra(
+            nome="Regra Uber",
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="UBER",
+            acao_valor="Transporte"
+        )
+        
+        transacao = Transacao(
+            data=date(2026, 1, 15),
+            descricao="Viagem uber eats",
+            valor=25.00,
+            tipo=TipoTransacao.SAIDA,
+            origem="fatura_cartao"
+        )
+        assert regra.corresponde_criterio(transacao) is True
+        
+        # Act
+        regra.criterio_valor = "99taxi"
+        
+        # Assert
+        assert regra.corresponde_criterio(transacao) is False
+    
     def test_categoria_igual_case_insensitive_retorna_true(self):
         """
         ARRANGE: Regra com critério CATEGORIA